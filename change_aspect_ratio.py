@@ -5,10 +5,14 @@ Supports multiple crop anchor positions for precise control and configurable let
 """
 
 import cv2
+import heapq
 import os
+import threading
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Tuple, List
+from typing import Callable, Tuple, List, Optional
 from enum import Enum
 
 from constants import (
@@ -53,6 +57,14 @@ from messages import (
 )
 
 
+# Parallelism comes from our own thread pools; stop OpenCV from spawning its
+# own per-call worker threads on top of them and oversubscribing the cores
+cv2.setNumThreads(0)
+
+# Prompt reader; tests swap this out instead of patching builtins.input
+_read_input = input
+
+
 class AspectRatioMode(Enum):
     """Aspect ratio adjustment modes."""
 
@@ -74,6 +86,21 @@ class CropAnchor(Enum):
     LOWER_RIGHT = "lower_right"
 
 
+# Horizontal/vertical position of the crop window for each anchor, as a
+# fraction of the spare space (0 = left/top, 1 = right/bottom)
+_ANCHOR_FRACTIONS = {
+    CropAnchor.CENTER: (0.5, 0.5),
+    CropAnchor.UPPER_LEFT: (0.0, 0.0),
+    CropAnchor.UPPER_CENTER: (0.5, 0.0),
+    CropAnchor.UPPER_RIGHT: (1.0, 0.0),
+    CropAnchor.CENTER_LEFT: (0.0, 0.5),
+    CropAnchor.CENTER_RIGHT: (1.0, 0.5),
+    CropAnchor.LOWER_LEFT: (0.0, 1.0),
+    CropAnchor.LOWER_CENTER: (0.5, 1.0),
+    CropAnchor.LOWER_RIGHT: (1.0, 1.0),
+}
+
+
 def calculate_crop_position(
     original_width: int,
     original_height: int,
@@ -94,38 +121,154 @@ def calculate_crop_position(
     Returns:
         Tuple of (x, y) coordinates for top-left corner of crop
     """
-    if anchor == CropAnchor.CENTER:
-        x = (original_width - target_width) // 2
-        y = (original_height - target_height) // 2
-    elif anchor == CropAnchor.UPPER_LEFT:
-        x, y = 0, 0
-    elif anchor == CropAnchor.UPPER_CENTER:
-        x = (original_width - target_width) // 2
-        y = 0
-    elif anchor == CropAnchor.UPPER_RIGHT:
-        x = original_width - target_width
-        y = 0
-    elif anchor == CropAnchor.CENTER_LEFT:
-        x = 0
-        y = (original_height - target_height) // 2
-    elif anchor == CropAnchor.CENTER_RIGHT:
-        x = original_width - target_width
-        y = (original_height - target_height) // 2
-    elif anchor == CropAnchor.LOWER_LEFT:
-        x = 0
-        y = original_height - target_height
-    elif anchor == CropAnchor.LOWER_CENTER:
-        x = (original_width - target_width) // 2
-        y = original_height - target_height
-    elif anchor == CropAnchor.LOWER_RIGHT:
-        x = original_width - target_width
-        y = original_height - target_height
+    # Unknown anchors default to center
+    x_frac, y_frac = _ANCHOR_FRACTIONS.get(anchor, (0.5, 0.5))
+    x = int((original_width - target_width) * x_frac)
+    y = int((original_height - target_height) * y_frac)
+    return max(0, x), max(0, y)
+
+
+# Per-thread scratch buffer for letterbox resizes; every frame of a video has
+# the same shape, so the buffer is allocated once and reused
+_scratch = threading.local()
+
+
+def _resize(
+    image: np.ndarray, width: int, height: int, reuse_buffer: bool = False
+) -> np.ndarray:
+    """
+    Resize an image with Lanczos interpolation.
+
+    Args:
+        image: Input image
+        width: Output width
+        height: Output height
+        reuse_buffer: Write into this thread's scratch buffer instead of a new
+            array. Only safe when the caller copies the result before the next
+            call (e.g. letterbox padding).
+
+    Returns:
+        Resized image
+    """
+    if not reuse_buffer:
+        return cv2.resize(image, (width, height), interpolation=cv2.INTER_LANCZOS4)
+
+    shape = (height, width) + image.shape[2:]
+    buffer = getattr(_scratch, "buffer", None)
+    if buffer is None or buffer.shape != shape or buffer.dtype != image.dtype:
+        buffer = _scratch.buffer = np.empty(shape, dtype=image.dtype)
+    return cv2.resize(
+        image, (width, height), dst=buffer, interpolation=cv2.INTER_LANCZOS4
+    )
+
+
+@lru_cache(maxsize=8)
+def _letterbox_geometry(
+    original_width: int, original_height: int, target_width: int, target_height: int
+) -> Tuple[int, int, int, int, int, int]:
+    """
+    Compute the scaled size and bar widths for letterboxing.
+
+    Returns:
+        Tuple of (new_width, new_height, pad_top, pad_bottom, pad_left, pad_right)
+    """
+    target_aspect = target_width / target_height
+    original_aspect = original_width / original_height
+
+    if original_aspect > target_aspect:
+        # Image is wider - fit to width, add bars top/bottom
+        new_width = target_width
+        new_height = int(target_width / original_aspect)
     else:
-        # Default to center
-        x = (original_width - target_width) // 2
-        y = (original_height - target_height) // 2
+        # Image is taller - fit to height, add bars left/right
+        new_height = target_height
+        new_width = int(target_height * original_aspect)
 
-    return max(0, x), max(0, y)
+    pad_left = (target_width - new_width) // 2
+    pad_top = (target_height - new_height) // 2
+    pad_right = target_width - new_width - pad_left
+    pad_bottom = target_height - new_height - pad_top
+
+    return new_width, new_height, pad_top, pad_bottom, pad_left, pad_right
+
+
+@lru_cache(maxsize=8)
+def _crop_geometry(
+    original_width: int,
+    original_height: int,
+    target_width: int,
+    target_height: int,
+    anchor: CropAnchor,
+) -> Tuple[int, int, int, int]:
+    """
+    Compute the crop window that matches the target aspect ratio.
+
+    Returns:
+        Tuple of (x, y, crop_width, crop_height)
+    """
+    target_aspect = target_width / target_height
+    original_aspect = original_width / original_height
+
+    if original_aspect > target_aspect:
+        # Image is wider - crop width
+        crop_height = original_height
+        crop_width = int(original_height * target_aspect)
+    else:
+        # Image is taller - crop height
+        crop_width = original_width
+        crop_height = int(original_width / target_aspect)
+
+    # Calculate crop position based on anchor
+    x, y = calculate_crop_position(
+        original_width, original_height, crop_width, crop_height, anchor
+    )
+    return x, y, crop_width, crop_height
+
+
+def make_letterbox_pipeline(
+    original_width: int,
+    original_height: int,
+    target_width: int,
+    target_height: int,
+    letterbox_color: Tuple[int, int, int] = LETTERBOX_COLOR_BLACK,
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build a letterbox function specialized for one input/output size.
+
+    The scaled size and bar widths are resolved here, so the returned
+    function only resizes and pads. Build it once per video or per run of
+    same-sized images and call it for every frame.
+
+    Args:
+        original_width: Input image width
+        original_height: Input image height
+        target_width: Target width
+        target_height: Target height
+        letterbox_color: BGR color for letterbox bars (default: black)
+
+    Returns:
+        Function mapping an input image to its letterboxed output
+    """
+    new_width, new_height, pad_top, pad_bottom, pad_left, pad_right = (
+        _letterbox_geometry(original_width, original_height, target_width, target_height)
+    )
+
+    def letterbox(image: np.ndarray) -> np.ndarray:
+        # Resize into scratch memory; copyMakeBorder copies it out below
+        resized = _resize(image, new_width, new_height, reuse_buffer=True)
+
+        # Pad with letterbox bars (BGR format for OpenCV) in a single pass
+        return cv2.copyMakeBorder(
+            resized,
+            pad_top,
+            pad_bottom,
+            pad_left,
+            pad_right,
+            cv2.BORDER_CONSTANT,
+            value=letterbox_color,
+        )
+
+    return letterbox
 
 
 def resize_with_aspect_ratio(
@@ -151,66 +294,25 @@ def resize_with_aspect_ratio(
         Resized image
     """
     original_height, original_width = image.shape[:2]
-    target_aspect = target_width / target_height
-    original_aspect = original_width / original_height
 
     if mode == AspectRatioMode.LETTERBOX:
         # Add bars to fit aspect ratio
-        if original_aspect > target_aspect:
-            # Image is wider - fit to width, add bars top/bottom
-            new_width = target_width
-            new_height = int(target_width / original_aspect)
-        else:
-            # Image is taller - fit to height, add bars left/right
-            new_height = target_height
-            new_width = int(target_height * original_aspect)
-
-        # Resize image
-        resized = cv2.resize(
-            image, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4
-        )
-
-        # Create canvas with specified color (BGR format for OpenCV)
-        canvas = np.full(
-            (target_height, target_width, image.shape[2]),
-            letterbox_color,
-            dtype=image.dtype,
+        letterbox = make_letterbox_pipeline(
+            original_width, original_height, target_width, target_height, letterbox_color
         )
-
-        # Center the resized image on canvas
-        x_offset = (target_width - new_width) // 2
-        y_offset = (target_height - new_height) // 2
-        canvas[y_offset : y_offset + new_height, x_offset : x_offset + new_width] = (
-            resized
-        )
-
-        return canvas
+        return letterbox(image)
 
     else:  # CROP mode
         # Crop to fit aspect ratio
-        if original_aspect > target_aspect:
-            # Image is wider - crop width
-            crop_height = original_height
-            crop_width = int(original_height * target_aspect)
-        else:
-            # Image is taller - crop height
-            crop_width = original_width
-            crop_height = int(original_width / target_aspect)
-
-        # Calculate crop position based on anchor
-        x, y = calculate_crop_position(
-            original_width, original_height, crop_width, crop_height, anchor
+        x, y, crop_width, crop_height = _crop_geometry(
+            original_width, original_height, target_width, target_height, anchor
         )
 
         # Crop image
         cropped = image[y : y + crop_height, x : x + crop_width]
 
         # Resize to target dimensions
-        resized = cv2.resize(
-            cropped, (target_width, target_height), interpolation=cv2.INTER_LANCZOS4
-        )
-
-        return resized
+        return _resize(cropped, target_width, target_height)
 
 
 def process_image(
@@ -308,22 +410,46 @@ def process_video(
         out = cv2.VideoWriter(output_path, fourcc, fps, (target_width, target_height))
 
         # Process each frame
+        process_frame = None
         frame_num = 0
         while True:
             ret, frame = cap.read()
             if not ret:
                 break
 
+            if process_frame is None:
+                # Every frame has the first frame's size, so the letterbox
+                # pipeline is built once and reused for the whole video
+                if mode == AspectRatioMode.LETTERBOX:
+                    frame_height, frame_width = frame.shape[:2]
+                    process_frame = make_letterbox_pipeline(
+                        frame_width,
+                        frame_height,
+                        target_width,
+                        target_height,
+                        letterbox_color,
+                    )
+                else:
+                    process_frame = partial(
+                        resize_with_aspect_ratio,
+                        target_width=target_width,
+                        target_height=target_height,
+                        mode=mode,
+                        anchor=anchor,
+                    )
+
             # Process frame
-            processed_frame = resize_with_aspect_ratio(
-                frame, target_width, target_height, mode, anchor, letterbox_color
-            )  # pyright: ignore[reportArgumentType]
-            out.write(processed_frame)
+            out.write(process_frame(frame))  # pyright: ignore[reportArgumentType]
 
             frame_num += 1
             if frame_num % VIDEO_PROGRESS_FRAME_INTERVAL == 0:
                 progress = (frame_num / frame_count) * 100
-                msg.info(video_frame_progress_info(frame_num, frame_count, progress))
+                # Videos run concurrently in batch_process, so name the file
+                msg.info(
+                    video_frame_progress_info(
+                        Path(input_path).name, frame_num, frame_count, progress
+                    )
+                )
 
         # Release resources
         cap.release()
@@ -337,13 +463,24 @@ def process_video(
         return False
 
 
-def get_media_files(folder: str, media_type: str = "both") -> List[Path]:
+# Extensions accepted by get_media_files for each media type
+_MEDIA_TYPE_EXTENSIONS = {
+    "images": frozenset(IMAGE_EXTENSIONS),
+    "videos": frozenset(VIDEO_EXTENSIONS),
+    "both": frozenset(IMAGE_EXTENSIONS | VIDEO_EXTENSIONS),
+}
+
+
+def get_media_files(
+    folder: str, media_type: str = "both", limit: Optional[int] = None
+) -> List[Path]:
     """
     Get all media files from a folder.
 
     Args:
         folder: Folder path
         media_type: "images", "videos", or "both"
+        limit: Return only the first N files in sorted order (default: all)
 
     Returns:
         List of media file paths
@@ -354,17 +491,18 @@ def get_media_files(folder: str, media_type: str = "both") -> List[Path]:
         msg.info(folder_setup_instructions(folder))
         return []
 
-    files = []
-
-    if media_type in ["images", "both"]:
-        for ext in IMAGE_EXTENSIONS:
-            files.extend(folder_path.glob(f"*{ext}"))
-
-    if media_type in ["videos", "both"]:
-        for ext in VIDEO_EXTENSIONS:
-            files.extend(folder_path.glob(f"*{ext}"))
+    extensions = _MEDIA_TYPE_EXTENSIONS.get(media_type, frozenset())
 
-    return sorted(files)
+    with os.scandir(folder_path) as entries:
+        files = (
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in extensions
+        )
+        # A bounded heap avoids sorting every entry of a huge folder
+        if limit is not None:
+            return heapq.nsmallest(limit, files)
+        return sorted(files)
 
 
 def batch_process(
@@ -376,10 +514,14 @@ def batch_process(
     anchor: CropAnchor = CropAnchor.CENTER,
     letterbox_color: Tuple[int, int, int] = LETTERBOX_COLOR_BLACK,
     media_type: str = "both",
+    max_workers: Optional[int] = None,
 ) -> None:
     """
     Batch process all media files in a folder.
 
+    Files are processed concurrently on a thread pool; OpenCV releases the GIL
+    during decode, resize and encode, so threads scale across cores.
+
     Args:
         input_folder: Input folder path
         output_folder: Output folder path
@@ -389,6 +531,8 @@ def batch_process(
         anchor: CropAnchor position (for CROP mode)
         letterbox_color: BGR color for letterbox bars (default: black)
         media_type: "images", "videos", or "both"
+        max_workers: Number of worker threads (default: os.cpu_count(),
+            capped at the number of files)
     """
     # Ensure output folder exists
     output_path = Path(output_folder)
@@ -406,8 +550,7 @@ def batch_process(
 
     batch_started(len(media_files), "files")
 
-    success_count = 0
-    for media_file in media_files:
+    def process_media_file(media_file: Path) -> bool:
         input_file = str(media_file)
         output_file = os.path.join(output_folder, media_file.name)
 
@@ -416,17 +559,7 @@ def batch_process(
         is_image = ext in IMAGE_EXTENSIONS
 
         if is_image:
-            success = process_image(
-                input_file,
-                output_file,
-                target_width,
-                target_height,
-                mode,
-                anchor,
-                letterbox_color,
-            )
-        else:
-            success = process_video(
+            return process_image(
                 input_file,
                 output_file,
                 target_width,
@@ -435,14 +568,44 @@ def batch_process(
                 anchor,
                 letterbox_color,
             )
+        return process_video(
+            input_file,
+            output_file,
+            target_width,
+            target_height,
+            mode,
+            anchor,
+            letterbox_color,
+        )
+
+    # Each task holds one decoded image or a few video frames at a time, so
+    # peak memory scales with the worker count; never start idle workers
+    workers = min(max_workers or os.cpu_count() or 1, len(media_files))
 
-        if success:
-            success_count += 1
+    # A single file gets no benefit from the outer pool, so let OpenCV
+    # parallelize internally instead; the caller's setting is restored after
+    previous_threads = cv2.getNumThreads()
+    cv2.setNumThreads(-1 if len(media_files) == 1 else 0)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            success_count = sum(executor.map(process_media_file, media_files))
+    finally:
+        cv2.setNumThreads(previous_threads)
 
     batch_completed(success_count, "files")
     msg.info(output_saved_to_folder_info(output_folder))
 
 
+# Preset menu entries 1-5, in menu order
+_ASPECT_RATIO_PRESETS = (
+    ASPECT_RATIO_16_9,
+    ASPECT_RATIO_4_3,
+    ASPECT_RATIO_1_1,
+    ASPECT_RATIO_9_16,
+    ASPECT_RATIO_21_9,
+)
+
+
 def get_aspect_ratio_input() -> Tuple[int, int]:
     """Get aspect ratio from user input."""
     print("\nCommon aspect ratios:")
@@ -453,22 +616,18 @@ def get_aspect_ratio_input() -> Tuple[int, int]:
     print("5. 21:9 (2560x1080) - Ultra-wide")
     print("6. Custom")
 
-    choice = input("\nSelect aspect ratio (1-6): ").strip()
+    choice = _read_input("\nSelect aspect ratio (1-6): ").strip()
 
-    if choice == "1":
-        return ASPECT_RATIO_16_9
-    elif choice == "2":
-        return ASPECT_RATIO_4_3
-    elif choice == "3":
-        return ASPECT_RATIO_1_1
-    elif choice == "4":
-        return ASPECT_RATIO_9_16
-    elif choice == "5":
-        return ASPECT_RATIO_21_9
+    try:
+        index = int(choice) - 1
+    except ValueError:
+        index = -1
+    if 0 <= index < len(_ASPECT_RATIO_PRESETS):
+        return _ASPECT_RATIO_PRESETS[index]
     elif choice == "6":
         try:
-            width = int(input("Enter target width: ").strip())
-            height = int(input("Enter target height: ").strip())
+            width = int(_read_input("Enter target width: ").strip())
+            height = int(_read_input("Enter target height: ").strip())
             return width, height
         except ValueError:
             msg.warning(invalid_input_default_warning("1920x1080"))
@@ -484,7 +643,7 @@ def get_mode_input() -> AspectRatioMode:
     print("1. Letterbox - Add bars to preserve full image")
     print("2. Crop - Crop image to fit aspect ratio")
 
-    choice = input("\nSelect mode (1-2): ").strip()
+    choice = _read_input("\nSelect mode (1-2): ").strip()
 
     if choice == "2":
         return AspectRatioMode.CROP
@@ -505,7 +664,7 @@ def get_anchor_input() -> CropAnchor:
     print("8. Lower Center")
     print("9. Lower Right")
 
-    choice = input("\nSelect crop focus (1-9, default: 1): ").strip()
+    choice = _read_input("\nSelect crop focus (1-9, default: 1): ").strip()
 
     if choice == "2":
         return CropAnchor.UPPER_LEFT
@@ -535,7 +694,7 @@ def get_letterbox_color_input() -> Tuple[int, int, int]:
     print("3. Gray (128, 128, 128)")
     print("4. Custom RGB")
 
-    choice = input("\nSelect color (1-4, default: 1): ").strip()
+    choice = _read_input("\nSelect color (1-4, default: 1): ").strip()
 
     if choice == "2":
         return LETTERBOX_COLOR_WHITE
@@ -543,9 +702,9 @@ def get_letterbox_color_input() -> Tuple[int, int, int]:
         return LETTERBOX_COLOR_GRAY
     elif choice == "4":
         try:
-            r = int(input(f"Enter Red value ({COLOR_MIN_VALUE}-{COLOR_MAX_VALUE}): ").strip())
-            g = int(input(f"Enter Green value ({COLOR_MIN_VALUE}-{COLOR_MAX_VALUE}): ").strip())
-            b = int(input(f"Enter Blue value ({COLOR_MIN_VALUE}-{COLOR_MAX_VALUE}): ").strip())
+            r = int(_read_input(f"Enter Red value ({COLOR_MIN_VALUE}-{COLOR_MAX_VALUE}): ").strip())
+            g = int(_read_input(f"Enter Green value ({COLOR_MIN_VALUE}-{COLOR_MAX_VALUE}): ").strip())
+            b = int(_read_input(f"Enter Blue value ({COLOR_MIN_VALUE}-{COLOR_MAX_VALUE}): ").strip())
             # Clamp values to valid range
             r = max(COLOR_MIN_VALUE, min(COLOR_MAX_VALUE, r))
             g = max(COLOR_MIN_VALUE, min(COLOR_MAX_VALUE, g))
@@ -570,7 +729,7 @@ def main():
     print("2. Videos only")
     print("3. Both images and videos")
 
-    type_choice = input("\nSelect option (1-3, default: 1): ").strip()
+    type_choice = _read_input("\nSelect option (1-3, default: 1): ").strip()
 
     if type_choice == "2":
         media_type = "videos"
@@ -587,11 +746,11 @@ def main():
 
     # Get folders
     input_folder = (
-        input(f"\nEnter input folder (default: '{default_input}'): ").strip()
+        _read_input(f"\nEnter input folder (default: '{default_input}'): ").strip()
         or default_input
     )
     output_folder = (
-        input(f"Enter output folder (default: '{default_output}'): ").strip()
+        _read_input(f"Enter output folder (default: '{default_output}'): ").strip()
         or default_output
     )
 
@@ -1,6 +1,8 @@
 import cv2
+import heapq
 import os
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
 
@@ -11,6 +13,7 @@ from constants import (
     DEFAULT_MAPPING_FILE,
     DEFAULT_TARGET_DURATION,
     DEFAULT_FADE_DURATION,
+    VIDEO_FRAME_BATCH_SIZE,
 )
 from messages import (
     msg,
@@ -32,6 +35,15 @@ from messages import (
     folder_setup_instructions,
 )
 
+# Fades already fan out over a thread pool; keep each cv2 call single-threaded
+cv2.setNumThreads(0)
+
+# Indirection over input() so tests can feed canned answers
+_read_input = input
+
+
+_VIDEO_EXTENSIONS = frozenset(VIDEO_EXTENSIONS)
+
 
 def ensure_folder_exists(folder: str, create: bool = True) -> bool:
     """
@@ -57,19 +69,25 @@ def ensure_folder_exists(folder: str, create: bool = True) -> bool:
     return True
 
 
-def get_video_files(folder: str) -> List[Path]:
-    """Get all video files from a folder"""
+def get_video_files(folder: str, limit: Optional[int] = None) -> List[Path]:
+    """Get all video files from a folder, optionally only the first `limit` in sorted order"""
     folder_path = Path(folder)
     if not folder_path.exists():
         msg.error(folder_not_exist_error(folder))
         msg.info(folder_setup_instructions(folder))
         return []
 
-    video_files = []
-    for ext in VIDEO_EXTENSIONS:
-        video_files.extend(folder_path.glob(f"*{ext}"))
-
-    return sorted(video_files)
+    with os.scandir(folder_path) as entries:
+        video_files = (
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in _VIDEO_EXTENSIONS
+        )
+        # A bounded heap avoids sorting every entry of a huge folder
+        if limit is not None:
+            return heapq.nsmallest(limit, video_files)
+        return sorted(video_files)
 
 
 def get_video_duration(video_path: str) -> Optional[float]:
@@ -95,9 +113,37 @@ def get_video_duration(video_path: str) -> Optional[float]:
         return None
 
 
-def apply_fade(frame: np.ndarray, alpha: float) -> np.ndarray:
-    """Apply fade effect to a frame using alpha blending"""
-    return (frame * alpha).astype(np.uint8)
+def apply_fade(
+    frame: np.ndarray, alpha: float, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Apply fade effect to a frame using alpha blending.
+
+    If out is given (same shape and dtype as frame), the faded frame is
+    written into it instead of a new array. Fully opaque frames are returned
+    as-is without touching out.
+    """
+    if alpha >= 1.0:
+        return frame
+    if alpha <= 0.0:
+        if out is None:
+            return np.zeros_like(frame)
+        out.fill(0)
+        return out
+
+    # Single saturating uint8 scale pass, no float temporary
+    return cv2.convertScaleAbs(frame, dst=out, alpha=alpha)
+
+
+def get_fade_alpha(frame_number: int, target_frames: int, fade_frames: int) -> float:
+    """Get the fade in/out alpha for a frame (1.0 outside the fade regions)"""
+    # Fade in at the beginning
+    if frame_number < fade_frames:
+        return frame_number / fade_frames
+    # Fade out at the end
+    if frame_number >= target_frames - fade_frames:
+        return (target_frames - frame_number) / fade_frames
+    return 1.0
 
 
 def create_video_mapping(
@@ -174,7 +220,6 @@ def create_video_with_duration(
     fourcc = cv2.VideoWriter_fourcc(*"mp4v")  # type: ignore[attr-defined]
     out = cv2.VideoWriter(output_video, fourcc, fps, (width, height))
 
-    frames_written = 0
     all_frames = []
 
     # Read all frames from input video
@@ -191,23 +236,38 @@ def create_video_with_duration(
         return False
 
     # Write frames until we reach target duration
-    while frames_written < target_frames:
-        frame_idx = frames_written % len(all_frames)
-        frame = all_frames[frame_idx].copy()
-
-        # Apply fade effects if enabled
-        if apply_fades:
-            # Fade in at the beginning
-            if frames_written < fade_frames:
-                alpha = frames_written / fade_frames
-                frame = apply_fade(frame, alpha)
-            # Fade out at the end
-            elif frames_written >= target_frames - fade_frames:
-                alpha = (target_frames - frames_written) / fade_frames
-                frame = apply_fade(frame, alpha)
-
-        out.write(frame)
-        frames_written += 1
+    if not apply_fades:
+        for frame_number in range(target_frames):
+            out.write(all_frames[frame_number % len(all_frames)])
+    else:
+        # One output slot per pool worker, never more than there are fade
+        # frames; a batch is fully written before the next one is rendered,
+        # so the slots are reused without allocating
+        slots = max(1, min(os.cpu_count() or 1, VIDEO_FRAME_BATCH_SIZE, fade_frames))
+        fade_buffers = np.empty((slots,) + all_frames[0].shape, dtype=np.uint8)
+
+        def render_frame(frame_number: int) -> np.ndarray:
+            frame = all_frames[frame_number % len(all_frames)]
+            alpha = get_fade_alpha(frame_number, target_frames, fade_frames)
+            slot = fade_buffers[frame_number % slots]
+            return apply_fade(frame, alpha, out=slot)
+
+        # Only the fade-in and fade-out frames are rendered, on a thread pool
+        # (cv2 releases the GIL) in batches of one frame per slot; the frames
+        # between them are unchanged and written straight through
+        fade_out_start = max(fade_frames, target_frames - fade_frames)
+        with ThreadPoolExecutor(max_workers=slots) as executor:
+
+            def write_faded(frame_numbers: range) -> None:
+                for start in range(frame_numbers.start, frame_numbers.stop, slots):
+                    batch = range(start, min(start + slots, frame_numbers.stop))
+                    for frame in executor.map(render_frame, batch):
+                        out.write(frame)
+
+            write_faded(range(min(fade_frames, target_frames)))
+            for frame_number in range(fade_frames, fade_out_start):
+                out.write(all_frames[frame_number % len(all_frames)])
+            write_faded(range(fade_out_start, target_frames))
 
     out.release()
     msg.success(video_created_success(output_video, target_duration))
@@ -257,7 +317,7 @@ def batch_adjust_durations(
 
 def get_float_input(prompt: str, default: float) -> float:
     """Helper function to get float input with default value"""
-    user_input = input(prompt).strip()
+    user_input = _read_input(prompt).strip()
     if not user_input:
         return default
     try:
@@ -269,7 +329,7 @@ def get_float_input(prompt: str, default: float) -> float:
 
 def get_yes_no_input(prompt: str, default: bool = False) -> bool:
     """Helper function to get yes/no input"""
-    user_input = input(prompt).strip().lower()
+    user_input = _read_input(prompt).strip().lower()
     if not user_input:
         return default
     return user_input in ["y", "yes", "true", "1"]
@@ -292,10 +352,10 @@ def main():
     print("2. Adjust all videos to specified duration")
     print("3. Both (mapping + adjustment)")
 
-    choice = input("\nEnter choice (1/2/3): ").strip()
+    choice = _read_input("\nEnter choice (1/2/3): ").strip()
 
     input_folder = (
-        input(f"Enter input folder name (default: '{DEFAULT_INPUT_FOLDER}'): ").strip()
+        _read_input(f"Enter input folder name (default: '{DEFAULT_INPUT_FOLDER}'): ").strip()
         or DEFAULT_INPUT_FOLDER
     )
 
@@ -307,7 +367,7 @@ def main():
 
     if choice == "1":
         mapping_file = (
-            input(
+            _read_input(
                 f"Enter mapping file name (default: '{DEFAULT_MAPPING_FILE}'): "
             ).strip()
             or DEFAULT_MAPPING_FILE
@@ -316,7 +376,7 @@ def main():
 
     elif choice == "2":
         output_folder = (
-            input(
+            _read_input(
                 f"Enter output folder name (default: '{DEFAULT_OUTPUT_FOLDER}'): "
             ).strip()
             or DEFAULT_OUTPUT_FOLDER
@@ -339,7 +399,7 @@ def main():
 
     elif choice == "3":
         mapping_file = (
-            input(
+            _read_input(
                 f"Enter mapping file name (default: '{DEFAULT_MAPPING_FILE}'): "
             ).strip()
             or DEFAULT_MAPPING_FILE
@@ -347,7 +407,7 @@ def main():
         create_video_mapping(input_folder, mapping_file, target_duration)
 
         output_folder = (
-            input(
+            _read_input(
                 f"Enter output folder name (default: '{DEFAULT_OUTPUT_FOLDER}'): "
             ).strip()
             or DEFAULT_OUTPUT_FOLDER
@@ -149,6 +149,9 @@ class ResamplingMethod(Enum):
 
 RESAMPLING_METHOD = ResamplingMethod.LANCZOS.value
 
+# Shrink ratios below this use BILINEAR instead of LANCZOS (visually equivalent, cheaper)
+BILINEAR_MAX_SHRINK_RATIO = 1.5
+
 # Video codec options
 class VideoCodec(Enum):
     """Common video codecs."""
@@ -225,6 +228,7 @@ LETTERBOX_COLOR_GRAY = (128, 128, 128)
 
 # Video processing
 VIDEO_PROGRESS_FRAME_INTERVAL = 30  # Show progress every N frames
+VIDEO_FRAME_BATCH_SIZE = 64  # Max fade frames rendered concurrently (output slots)
 VIDEO_CODEC_MP4V = "mp4v"
 
 # Color value limits
@@ -70,20 +70,28 @@ class MessageHandler:
         return f"{color}{Colors.BOLD}[{prefix}]{Colors.RESET} {message}"
 
     def error(self, message, prefix="ERROR"):
-        """Print error message to stderr."""
-        print(self._format(MessageType.ERROR, message, prefix), file=sys.stderr)
+        """Print error message to stderr and return the formatted line."""
+        line = self._format(MessageType.ERROR, message, prefix)
+        print(line, file=sys.stderr)
+        return line
 
     def success(self, message, prefix="SUCCESS"):
-        """Print success message."""
-        print(self._format(MessageType.SUCCESS, message, prefix))
+        """Print success message and return the formatted line."""
+        line = self._format(MessageType.SUCCESS, message, prefix)
+        print(line)
+        return line
 
     def warning(self, message, prefix="WARNING"):
-        """Print warning message."""
-        print(self._format(MessageType.WARNING, message, prefix))
+        """Print warning message and return the formatted line."""
+        line = self._format(MessageType.WARNING, message, prefix)
+        print(line)
+        return line
 
     def info(self, message, prefix="INFO"):
-        """Print info message."""
-        print(self._format(MessageType.INFO, message, prefix))
+        """Print info message and return the formatted line."""
+        line = self._format(MessageType.INFO, message, prefix)
+        print(line)
+        return line
 
 
 class ToolException(Exception):
@@ -454,9 +462,11 @@ def video_processing_failed_error(file_path: str, error: Exception) -> str:
     return f"Error processing video {file_path}: {error}"
 
 
-def video_frame_progress_info(frame_num: int, frame_count: int, progress: float) -> str:
+def video_frame_progress_info(
+    filename: str, frame_num: int, frame_count: int, progress: float
+) -> str:
     """Info message for video frame processing progress."""
-    return f"Processing frame {frame_num}/{frame_count} ({progress:.1f}%)"
+    return f"Processing {filename}: frame {frame_num}/{frame_count} ({progress:.1f}%)"
 
 
 def video_processed_success(filename: str) -> str:
@@ -6,8 +6,10 @@ Compresses and resizes images while maintaining quality.
 
 import sys
 from pathlib import Path
+from typing import NamedTuple, Optional, Tuple
 from PIL import Image
 import argparse
+
 from constants import (
     IMAGE_EXTENSIONS,
     DEFAULT_MAX_WEB_WIDTH,
@@ -19,6 +21,8 @@ from constants import (
     MODES_REQUIRING_RGB_CONVERSION,
     DEFAULT_IMAGES_INPUT_DIR,
     DEFAULT_IMAGES_OUTPUT_DIR,
+    ResamplingMethod,
+    BILINEAR_MAX_SHRINK_RATIO,
 )
 from messages import (
     msg,
@@ -33,6 +37,21 @@ from messages import (
     handle_exception,
 )
 
+try:
+    import numpy as np
+    import simplejpeg
+except ImportError:  # Optional: only needed for fast_jpeg
+    simplejpeg = None
+
+
+class OptimizeResult(NamedTuple):
+    """Outcome of optimizing a single image."""
+
+    path: Path
+    original_size: int
+    optimized_size: int
+    dimensions: Optional[Tuple[int, int]]  # Set only when the image was resized
+
 
 def optimize_image(
     input_path,
@@ -41,6 +60,8 @@ def optimize_image(
     max_height=DEFAULT_MAX_WEB_HEIGHT,
     quality=DEFAULT_WEB_QUALITY,
     format=None,
+    resample=None,
+    fast_jpeg=False,
 ):
     """
     Optimize an image for web use.
@@ -52,9 +73,15 @@ def optimize_image(
         max_height: Maximum height in pixels
         quality: JPEG/WebP quality (1-100)
         format: Output format (jpg, png, webp). If None, uses input format
+        resample: Resampling method name (nearest, bilinear, bicubic, lanczos).
+            If None, uses BILINEAR for small shrinks and LANCZOS otherwise
+        fast_jpeg: Encode RGB JPEG output with simplejpeg (libjpeg-turbo,
+            baseline, 4:2:0) instead of Pillow's progressive, optimized
+            encoder. Faster but larger files; ignored if simplejpeg is
+            not installed
 
     Returns:
-        Path to optimized image
+        OptimizeResult with output path, file sizes (bytes) and new dimensions
     """
     input_path = Path(input_path)
 
@@ -64,22 +91,34 @@ def optimize_image(
     # Open and process image
     img = Image.open(input_path)
 
-    # Convert RGBA to RGB if saving as JPEG
     output_format = format.upper() if format else img.format
-    if output_format == "JPEG" and img.mode in MODES_REQUIRING_RGB_CONVERSION:
+    if output_format == "JPG":
+        output_format = "JPEG"
+    needs_rgb = output_format == "JPEG" and img.mode in MODES_REQUIRING_RGB_CONVERSION
+
+    # Palette images resize with NEAREST only, so expand them first
+    if needs_rgb and img.mode == "P":
+        img = img.convert("RGBA")
+
+    # Resize before flattening alpha so the white background canvas is
+    # allocated at output size rather than at (possibly huge) input size.
+    # thumbnail() can only draft (decode at reduced scale) JPEG inputs; other
+    # formats, and palette images already expanded to RGBA above, are
+    # decoded at full size first.
+    dimensions = None
+    if img.width > max_width or img.height > max_height:
+        resample_filter = select_resampling(img, max_width, max_height, resample)
+        img.thumbnail((max_width, max_height), resample_filter)
+        dimensions = (img.width, img.height)
+
+    # Convert RGBA to RGB if saving as JPEG
+    if needs_rgb:
         background = Image.new(RGB_MODE, img.size, (255, 255, 255))
-        if img.mode == "P":
-            img = img.convert("RGBA")
         background.paste(
-            img, mask=img.split()[-1] if img.mode in ("RGBA", "LA") else None
+            img, mask=img.getchannel("A") if img.mode in ("RGBA", "LA") else None
         )
         img = background
 
-    # Resize if needed
-    if img.width > max_width or img.height > max_height:
-        img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-        dimensions_info(img.width, img.height, "Resized")
-
     # Determine output path
     if output_path is None:
         ext = f".{format.lower()}" if format else input_path.suffix
@@ -88,9 +127,30 @@ def optimize_image(
         output_path = Path(output_path)
 
     # Save optimized image
+    if (
+        fast_jpeg
+        and output_format == "JPEG"
+        and simplejpeg is not None
+        and img.mode == RGB_MODE
+    ):
+        # libjpeg-turbo directly, bypassing Pillow's save dispatch
+        data = simplejpeg.encode_jpeg(
+            np.asarray(img, dtype=np.uint8),
+            quality=quality,
+            colorspace="RGB",
+            colorsubsampling="420",
+        )
+        output_path.write_bytes(data)
+        return OptimizeResult(
+            output_path,
+            input_path.stat().st_size,
+            len(data),
+            dimensions,
+        )
+
     save_kwargs: dict = {"optimize": True}
 
-    if output_format in ("JPEG", "JPG"):
+    if output_format == "JPEG":
         save_kwargs["quality"] = quality
         save_kwargs["progressive"] = True
     elif output_format == "PNG":
@@ -101,13 +161,80 @@ def optimize_image(
 
     img.save(output_path, **save_kwargs)
 
-    # Print size comparison
-    original_size = input_path.stat().st_size
-    optimized_size = output_path.stat().st_size
+    return OptimizeResult(
+        output_path,
+        input_path.stat().st_size,
+        output_path.stat().st_size,
+        dimensions,
+    )
+
 
-    size_info(original_size / 1024, optimized_size / 1024)
+def select_resampling(img, max_width, max_height, resample=None):
+    """
+    Pick the resampling filter for a thumbnail operation.
 
-    return output_path
+    Args:
+        img: Image to be resized
+        max_width: Maximum width in pixels
+        max_height: Maximum height in pixels
+        resample: Explicit resampling method name, or None to choose automatically
+
+    Returns:
+        PIL resampling filter
+    """
+    if resample:
+        return Image.Resampling[resample.upper()]
+
+    ratio = max(img.width / max_width, img.height / max_height)
+    if ratio < BILINEAR_MAX_SHRINK_RATIO:
+        return Image.Resampling.BILINEAR
+    return Image.Resampling.LANCZOS
+
+
+def print_result(result):
+    """Print dimension and size details for a single optimized image."""
+    if result.dimensions:
+        dimensions_info(*result.dimensions, "Resized")
+    size_info(result.original_size / 1024, result.optimized_size / 1024)
+
+
+def format_summary(results, failures):
+    """
+    Render a batch summary as a single block of text.
+
+    Args:
+        results: List of OptimizeResult for successfully optimized images
+        failures: List of (filename, error) tuples
+
+    Returns:
+        Summary table string, with a totals row over the successful images
+    """
+    lines = [f"  {'File':<40} {'Original':>12} {'Optimized':>12} {'Change':>8}  Resized"]
+    for result in results:
+        original_kb = result.original_size / 1024
+        optimized_kb = result.optimized_size / 1024
+        change = ((optimized_kb - original_kb) / original_kb) * 100 if original_kb else 0.0
+        resized = f"{result.dimensions[0]}x{result.dimensions[1]}" if result.dimensions else "-"
+        lines.append(
+            f"  {result.path.name:<40} {original_kb:>9.2f} KB {optimized_kb:>9.2f} KB "
+            f"{change:>7.1f}%  {resized}"
+        )
+    if results:
+        total_original_kb = sum(result.original_size for result in results) / 1024
+        total_optimized_kb = sum(result.optimized_size for result in results) / 1024
+        total_change = (
+            ((total_optimized_kb - total_original_kb) / total_original_kb) * 100
+            if total_original_kb
+            else 0.0
+        )
+        resized_count = sum(1 for result in results if result.dimensions)
+        lines.append(
+            f"  {'Total':<40} {total_original_kb:>9.2f} KB {total_optimized_kb:>9.2f} KB "
+            f"{total_change:>7.1f}%  {resized_count}/{len(results)}"
+        )
+    for name, error in failures:
+        lines.append(f"  {name:<40} FAILED: {error}")
+    return "\n".join(lines)
 
 
 def optimize_directory(input_dir, output_dir=None, **kwargs):
@@ -145,20 +272,28 @@ def optimize_directory(input_dir, output_dir=None, **kwargs):
 
     batch_started(len(image_files), "images")
 
-    success_count = 0
-    fail_count = 0
+    # Collect per-image results and report them once at the end
+    results = []
+    failures = []
+
+    # Converted outputs take the chosen format's extension
+    output_format = kwargs.get("format")
+    suffix = f".{output_format.lower()}" if output_format else None
 
     for img_file in image_files:
-        processing_started("Processing", img_file)
         try:
-            out_path = output_dir / img_file.name if output_dir else None
-            optimize_image(img_file, out_path, **kwargs)
-            success_count += 1
-            print()
+            out_path = None
+            if output_dir:
+                out_name = img_file.with_suffix(suffix).name if suffix else img_file.name
+                out_path = output_dir / out_name
+            results.append(optimize_image(img_file, out_path, **kwargs))
         except Exception as e:
-            msg.error(f"Error processing {img_file.name}: {e}")
-            fail_count += 1
-            print()
+            failures.append((img_file.name, e))
+
+    print(format_summary(results, failures))
+
+    success_count = len(results)
+    fail_count = len(failures)
 
     # Summary
     if fail_count == 0:
@@ -220,9 +355,22 @@ Examples:
         choices=["jpg", "png", "webp"],
         help="Output format (jpg, png, webp)",
     )
+    parser.add_argument(
+        "--resample",
+        choices=[m.value.lower() for m in ResamplingMethod],
+        help="Resampling filter (default: bilinear for small shrinks, lanczos otherwise)",
+    )
+    parser.add_argument(
+        "--fast-jpeg",
+        action="store_true",
+        help="Encode JPEGs with simplejpeg: faster, but baseline and larger than the default",
+    )
 
     args = parser.parse_args()
 
+    if args.fast_jpeg and simplejpeg is None:
+        parser.error("--fast-jpeg requires simplejpeg and numpy (pip install simplejpeg numpy)")
+
     try:
         if args.dir:
             with Operation("Batch optimization"):
@@ -233,9 +381,12 @@ Examples:
                     max_height=args.max_height,
                     quality=args.quality,
                     format=args.format,
+                    resample=args.resample,
+                    fast_jpeg=args.fast_jpeg,
                 )
         elif args.input:
             with Operation("Image optimization"):
+                processing_started("Processing", args.input)
                 result = optimize_image(
                     args.input,
                     args.output,
@@ -243,8 +394,11 @@ Examples:
                     max_height=args.max_height,
                     quality=args.quality,
                     format=args.format,
+                    resample=args.resample,
+                    fast_jpeg=args.fast_jpeg,
                 )
-                msg.info(f"Optimized image saved to: {result}")
+                print_result(result)
+                msg.info(f"Optimized image saved to: {result.path}")
         else:
             parser.print_help()
             sys.exit(1)
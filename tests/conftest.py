@@ -1,17 +1,40 @@
 """Shared pytest fixtures and configuration."""
 
 import pytest
+import os
 from pathlib import Path
+import sys
 import tempfile
 import shutil
+import numpy as np
+
+# Make the tool modules importable from every test module, once per session
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Keep test output in RAM where a tmpfs is available (Linux)
+TEMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+_CREATED_BASETEMP = pytest.StashKey[str]()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Root tmp_path (and so temp_dir) on TEMP_ROOT unless --basetemp is given."""
+    if TEMP_ROOT is not None and config.option.basetemp is None:
+        config.option.basetemp = tempfile.mkdtemp(prefix="pytest-", dir=TEMP_ROOT)
+        config.stash[_CREATED_BASETEMP] = config.option.basetemp
+
+
+def pytest_unconfigure(config):
+    """Remove the basetemp created by pytest_configure."""
+    basetemp = config.stash.get(_CREATED_BASETEMP, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create a temporary directory for testing."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path)
+    return tmp_path
 
 
 @pytest.fixture
@@ -40,3 +63,48 @@ def output_folder(temp_dir):
     folder = temp_dir / "output"
     folder.mkdir()
     return folder
+
+
+@pytest.fixture
+def feed_input(monkeypatch):
+    """Replace a module's _read_input with canned answers, returned in order."""
+    def feed(module, *answers):
+        remaining = iter(answers)
+        monkeypatch.setattr(module, "_read_input", lambda prompt="": next(remaining))
+    return feed
+
+
+@pytest.fixture(scope="session")
+def img_1920x1080_white():
+    """Read-only 1920x1080 white BGR image shared across the session."""
+    image = np.full((1080, 1920, 3), 255, dtype=np.uint8)
+    image.flags.writeable = False
+    return image
+
+
+@pytest.fixture(scope="session")
+def img_1920x1080_quadrants():
+    """Read-only 1920x1080 image with red/green/blue/yellow quadrants."""
+
+    def quadrant(color):
+        return np.broadcast_to(np.array(color, dtype=np.uint8), (540, 960, 3))
+
+    # Zero-copy quadrant views assembled into one contiguous allocation; the
+    # innermost lists are one element deep so np.block joins rows and columns
+    # rather than channels
+    image = np.block(
+        [
+            [[quadrant([255, 0, 0])], [quadrant([0, 255, 0])]],  # Red | green
+            [[quadrant([0, 0, 255])], [quadrant([255, 255, 0])]],  # Blue | yellow
+        ]
+    )
+    image.flags.writeable = False
+    return image
+
+
+@pytest.fixture(scope="session")
+def default_font():
+    """Default text_to_image font at DEFAULT_FONT_SIZE, loaded once per session."""
+    from text_to_image import get_default_font, DEFAULT_FONT_SIZE
+
+    return get_default_font(DEFAULT_FONT_SIZE)
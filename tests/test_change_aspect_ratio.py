@@ -1,20 +1,25 @@
 """Tests for change_aspect_ratio module."""
 
-from pathlib import Path
-import sys
+import cv2
 import numpy as np
-from unittest.mock import patch
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
+import change_aspect_ratio
 from change_aspect_ratio import (
     AspectRatioMode,
     CropAnchor,
     calculate_crop_position,
     resize_with_aspect_ratio,
+    make_letterbox_pipeline,
+    process_video,
+    batch_process,
     get_media_files,
+    get_aspect_ratio_input,
+    get_mode_input,
+    get_anchor_input,
+    get_letterbox_color_input,
 )
+from constants import LETTERBOX_COLOR_BLACK
 
 
 class TestAspectRatioMode:
@@ -137,25 +142,22 @@ class TestCalculateCropPosition:
 class TestResizeWithAspectRatio:
     """Test resize_with_aspect_ratio function."""
 
-    def test_letterbox_wider_image(self):
+    def test_letterbox_wider_image(self, img_1920x1080_white):
         """Test letterbox mode with wider image (adds top/bottom bars)."""
-        # Create a 1920x1080 image
-        image = np.ones((1080, 1920, 3), dtype=np.uint8) * 255
-
         # Resize to 1080x1080 (square) with default black bars
         result = resize_with_aspect_ratio(
-            image, 1080, 1080, AspectRatioMode.LETTERBOX
+            img_1920x1080_white, 1080, 1080, AspectRatioMode.LETTERBOX
         )
 
         assert result.shape == (1080, 1080, 3)
         # Top and bottom should have black bars
-        assert np.all(result[0, :] == 0)  # Top row is black
-        assert np.all(result[-1, :] == 0)  # Bottom row is black
+        assert result[0].max() == 0  # Top row is black
+        assert result[-1].max() == 0  # Bottom row is black
 
     def test_letterbox_with_white_bars(self):
         """Test letterbox mode with white bars."""
         # Create a 1920x1080 image
-        image = np.ones((1080, 1920, 3), dtype=np.uint8) * 128
+        image = np.full((1080, 1920, 3), 128, dtype=np.uint8)
 
         # Resize to 1080x1080 with white bars
         result = resize_with_aspect_ratio(
@@ -165,13 +167,13 @@ class TestResizeWithAspectRatio:
 
         assert result.shape == (1080, 1080, 3)
         # Top and bottom should have white bars
-        assert np.all(result[0, :] == 255)  # Top row is white
-        assert np.all(result[-1, :] == 255)  # Bottom row is white
+        assert result[0].min() == 255  # Top row is white
+        assert result[-1].min() == 255  # Bottom row is white
 
     def test_letterbox_with_custom_color(self):
         """Test letterbox mode with custom color bars."""
         # Create a 1920x1080 image
-        image = np.ones((1080, 1920, 3), dtype=np.uint8) * 100
+        image = np.full((1080, 1920, 3), 100, dtype=np.uint8)
 
         # Resize with custom gray bars (128, 128, 128) in BGR
         result = resize_with_aspect_ratio(
@@ -181,12 +183,13 @@ class TestResizeWithAspectRatio:
 
         assert result.shape == (1080, 1080, 3)
         # Top row should have the custom color
-        assert np.all(result[0, :] == 128)
+        top_row = result[0]
+        assert top_row.min() == top_row.max() == 128
 
     def test_letterbox_taller_image(self):
         """Test letterbox mode with taller image (adds left/right bars)."""
         # Create a 1080x1920 image (portrait)
-        image = np.ones((1920, 1080, 3), dtype=np.uint8) * 255
+        image = np.full((1920, 1080, 3), 255, dtype=np.uint8)
 
         # Resize to 1920x1080 (landscape)
         result = resize_with_aspect_ratio(
@@ -195,58 +198,41 @@ class TestResizeWithAspectRatio:
 
         assert result.shape == (1080, 1920, 3)
         # Left and right should have black bars
-        assert np.all(result[:, 0] == 0)  # Left column is black
-        assert np.all(result[:, -1] == 0)  # Right column is black
+        assert result[:, 0].max() == 0  # Left column is black
+        assert result[:, -1].max() == 0  # Right column is black
 
-    def test_crop_center(self):
+    def test_crop_center(self, img_1920x1080_white):
         """Test crop mode with center anchor."""
-        # Create a 1920x1080 image
-        image = np.ones((1080, 1920, 3), dtype=np.uint8) * 255
-
         # Resize to 1080x1080 (square) with center crop
         result = resize_with_aspect_ratio(
-            image, 1080, 1080, AspectRatioMode.CROP, CropAnchor.CENTER
+            img_1920x1080_white, 1080, 1080, AspectRatioMode.CROP, CropAnchor.CENTER
         )
 
         assert result.shape == (1080, 1080, 3)
 
-    def test_crop_upper_left(self):
+    def test_crop_upper_left(self, img_1920x1080_quadrants):
         """Test crop mode with upper left anchor."""
-        # Create a test image with distinct colors in corners
-        image = np.zeros((1080, 1920, 3), dtype=np.uint8)
-        image[:540, :960] = [255, 0, 0]  # Upper left = red
-        image[:540, 960:] = [0, 255, 0]  # Upper right = green
-        image[540:, :960] = [0, 0, 255]  # Lower left = blue
-        image[540:, 960:] = [255, 255, 0]  # Lower right = yellow
-
         # Crop to square with upper left anchor
         result = resize_with_aspect_ratio(
-            image, 1080, 1080, AspectRatioMode.CROP, CropAnchor.UPPER_LEFT
+            img_1920x1080_quadrants, 1080, 1080, AspectRatioMode.CROP, CropAnchor.UPPER_LEFT
         )
 
         assert result.shape == (1080, 1080, 3)
         # The upper left corner should be predominantly red
         assert result[0, 0, 0] > 200  # High red value
 
-    def test_crop_lower_right(self):
+    def test_crop_lower_right(self, img_1920x1080_quadrants):
         """Test crop mode with lower right anchor."""
-        # Create a test image with distinct colors
-        image = np.zeros((1080, 1920, 3), dtype=np.uint8)
-        image[:540, :960] = [255, 0, 0]  # Upper left = red
-        image[:540, 960:] = [0, 255, 0]  # Upper right = green
-        image[540:, :960] = [0, 0, 255]  # Lower left = blue
-        image[540:, 960:] = [255, 255, 0]  # Lower right = yellow
-
         # Crop to square with lower right anchor
         result = resize_with_aspect_ratio(
-            image, 1080, 1080, AspectRatioMode.CROP, CropAnchor.LOWER_RIGHT
+            img_1920x1080_quadrants, 1080, 1080, AspectRatioMode.CROP, CropAnchor.LOWER_RIGHT
         )
 
         assert result.shape == (1080, 1080, 3)
 
     def test_maintains_image_dtype(self):
         """Test that output maintains input dtype."""
-        image = np.ones((1080, 1920, 3), dtype=np.uint8) * 128
+        image = np.full((1080, 1920, 3), 128, dtype=np.uint8)
 
         result = resize_with_aspect_ratio(
             image, 1080, 1080, AspectRatioMode.LETTERBOX
@@ -255,6 +241,103 @@ class TestResizeWithAspectRatio:
         assert result.dtype == np.uint8
 
 
+class TestMakeLetterboxPipeline:
+    """Test make_letterbox_pipeline function."""
+
+    def test_matches_resize_with_aspect_ratio(self, img_1920x1080_quadrants):
+        """Test pipeline output is identical to the generic letterbox path."""
+        letterbox = make_letterbox_pipeline(1920, 1080, 1080, 1080, (0, 0, 255))
+
+        result = letterbox(img_1920x1080_quadrants)
+        expected = resize_with_aspect_ratio(
+            img_1920x1080_quadrants, 1080, 1080, letterbox_color=(0, 0, 255)
+        )
+
+        assert result.shape == (1080, 1080, 3)
+        assert result.tobytes() == expected.tobytes()
+
+
+class TestProcessVideo:
+    """Test process_video function."""
+
+    @staticmethod
+    def _write_video(path, frame_count, width=64, height=48):
+        """Write a short mp4v video with one solid gray level per frame."""
+        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+        writer = cv2.VideoWriter(str(path), fourcc, 10, (width, height))
+        for i in range(frame_count):
+            writer.write(np.full((height, width, 3), 40 * i, dtype=np.uint8))
+        writer.release()
+
+    @staticmethod
+    def _read_frames(path):
+        """Read every frame of a video."""
+        cap = cv2.VideoCapture(str(path))
+        frames = []
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+        cap.release()
+        return frames
+
+    def test_letterbox_writes_every_frame(self, tmp_path):
+        """Test every input frame is letterboxed to the target size in order."""
+        input_video = tmp_path / "input.mp4"
+        output_video = tmp_path / "output.mp4"
+        self._write_video(input_video, 5)
+
+        assert process_video(str(input_video), str(output_video), 48, 48)
+
+        frames = self._read_frames(output_video)
+        assert len(frames) == 5
+        assert all(frame.shape == (48, 48, 3) for frame in frames)
+        # 64x48 into 48x48 leaves 6-pixel black bars above and below
+        assert frames[4][:6].max() < 16
+        levels = [int(frame[24, 24, 0]) for frame in frames]
+        assert levels == sorted(levels)
+        assert levels[4] > levels[0] + 100
+
+    def test_letterbox_pipeline_built_once(self, tmp_path, monkeypatch):
+        """Test the letterbox pipeline is built from the first frame and reused."""
+        input_video = tmp_path / "input.mp4"
+        self._write_video(input_video, 4)
+        builds = []
+        make_pipeline = change_aspect_ratio.make_letterbox_pipeline
+
+        def record(*args):
+            builds.append(args)
+            return make_pipeline(*args)
+
+        monkeypatch.setattr(change_aspect_ratio, "make_letterbox_pipeline", record)
+
+        assert process_video(str(input_video), str(tmp_path / "output.mp4"), 48, 48)
+
+        assert builds == [(64, 48, 48, 48, LETTERBOX_COLOR_BLACK)]
+
+    def test_crop_writes_every_frame(self, tmp_path):
+        """Test crop mode writes every frame at the target size."""
+        input_video = tmp_path / "input.mp4"
+        output_video = tmp_path / "output.mp4"
+        self._write_video(input_video, 3)
+
+        assert process_video(
+            str(input_video), str(output_video), 48, 48, AspectRatioMode.CROP
+        )
+
+        frames = self._read_frames(output_video)
+        assert len(frames) == 3
+        assert all(frame.shape == (48, 48, 3) for frame in frames)
+
+    def test_unreadable_video(self, tmp_path):
+        """Test a file that is not a video fails cleanly."""
+        input_video = tmp_path / "broken.mp4"
+        input_video.write_bytes(b"not a video")
+
+        assert not process_video(str(input_video), str(tmp_path / "out.mp4"), 48, 48)
+
+
 class TestGetMediaFiles:
     """Test get_media_files function."""
 
@@ -312,203 +395,244 @@ class TestGetMediaFiles:
         file_names = [f.name for f in files]
         assert file_names == sorted(file_names)
 
+    def test_limit_returns_first_sorted(self, temp_dir):
+        """Test that limit keeps only the first files in sorted order."""
+        for name in ("c", "a", "d", "b"):
+            (temp_dir / f"{name}.jpg").touch()
+
+        files = get_media_files(str(temp_dir), "both", limit=2)
+        assert [f.name for f in files] == ["a.jpg", "b.jpg"]
+
+
+class TestBatchProcess:
+    """Test batch_process function."""
+
+    @staticmethod
+    def _write_images(folder, names):
+        """Write one small distinct BGR image per name."""
+        folder.mkdir(exist_ok=True)
+        for i, name in enumerate(names):
+            cv2.imwrite(str(folder / name), np.full((48, 64, 3), 30 * i, dtype=np.uint8))
+
+    def test_processes_every_file(self, temp_dir):
+        """Test every file is written at the target size from its own input."""
+        names = ["a.png", "b.png", "c.png", "d.png"]
+        self._write_images(temp_dir / "in", names)
+
+        batch_process(str(temp_dir / "in"), str(temp_dir / "out"), 48, 48, max_workers=3)
+
+        for i, name in enumerate(names):
+            result = cv2.imread(str(temp_dir / "out" / name))
+            assert result.shape == (48, 48, 3)
+            assert result[24, 24, 0] == 30 * i  # Not another file's pixels
+
+    @pytest.mark.parametrize(
+        "names, expected_threads",
+        [
+            (["only.png"], -1),  # Lone file: let OpenCV use its own threads
+            (["a.png", "b.png"], 0),  # Outer pool: keep cv2 single-threaded
+        ],
+    )
+    def test_opencv_threading(self, temp_dir, monkeypatch, names, expected_threads):
+        """Test OpenCV threading is enabled only for a one-file batch, then restored."""
+        calls = []
+        monkeypatch.setattr(change_aspect_ratio.cv2, "getNumThreads", lambda: 3)
+        monkeypatch.setattr(change_aspect_ratio.cv2, "setNumThreads", calls.append)
+        self._write_images(temp_dir / "in", names)
+
+        batch_process(str(temp_dir / "in"), str(temp_dir / "out"), 48, 48)
+
+        assert calls == [expected_threads, 3]
+        assert len(list((temp_dir / "out").iterdir())) == len(names)
+
+    def test_worker_error_propagates(self, temp_dir, monkeypatch):
+        """Test an exception raised in a worker reaches the caller."""
+        self._write_images(temp_dir / "in", ["a.png", "b.png"])
+
+        def fail(input_path, *args):
+            if input_path.endswith("b.png"):
+                raise RuntimeError("worker failed")
+            return True
+
+        monkeypatch.setattr(change_aspect_ratio, "process_image", fail)
+        threads = cv2.getNumThreads()
+
+        with pytest.raises(RuntimeError, match="worker failed"):
+            batch_process(str(temp_dir / "in"), str(temp_dir / "out"), 48, 48)
+
+        assert cv2.getNumThreads() == threads
+
 
 class TestAspectRatioInputFunctions:
     """Test input helper functions."""
 
-    @patch('builtins.input', side_effect=['1'])
-    def test_get_aspect_ratio_16_9(self, mock_input):
+    def test_get_aspect_ratio_16_9(self, feed_input):
         """Test selecting 16:9 aspect ratio."""
-        from change_aspect_ratio import get_aspect_ratio_input
+        feed_input(change_aspect_ratio, '1')
         width, height = get_aspect_ratio_input()
         assert width == 1920
         assert height == 1080
 
-    @patch('builtins.input', side_effect=['2'])
-    def test_get_aspect_ratio_4_3(self, mock_input):
+    def test_get_aspect_ratio_4_3(self, feed_input):
         """Test selecting 4:3 aspect ratio."""
-        from change_aspect_ratio import get_aspect_ratio_input
+        feed_input(change_aspect_ratio, '2')
         width, height = get_aspect_ratio_input()
         assert width == 1024
         assert height == 768
 
-    @patch('builtins.input', side_effect=['3'])
-    def test_get_aspect_ratio_1_1(self, mock_input):
+    def test_get_aspect_ratio_1_1(self, feed_input):
         """Test selecting 1:1 (square) aspect ratio."""
-        from change_aspect_ratio import get_aspect_ratio_input
+        feed_input(change_aspect_ratio, '3')
         width, height = get_aspect_ratio_input()
         assert width == 1080
         assert height == 1080
 
-    @patch('builtins.input', side_effect=['4'])
-    def test_get_aspect_ratio_9_16(self, mock_input):
+    def test_get_aspect_ratio_9_16(self, feed_input):
         """Test selecting 9:16 (vertical) aspect ratio."""
-        from change_aspect_ratio import get_aspect_ratio_input
+        feed_input(change_aspect_ratio, '4')
         width, height = get_aspect_ratio_input()
         assert width == 1080
         assert height == 1920
 
-    @patch('builtins.input', side_effect=['6', '1280', '720'])
-    def test_get_aspect_ratio_custom(self, mock_input):
+    def test_get_aspect_ratio_custom(self, feed_input):
         """Test custom aspect ratio input."""
-        from change_aspect_ratio import get_aspect_ratio_input
+        feed_input(change_aspect_ratio, '6', '1280', '720')
         width, height = get_aspect_ratio_input()
         assert width == 1280
         assert height == 720
 
-    @patch('builtins.input', side_effect=['6', 'invalid', 'also_invalid'])
-    def test_get_aspect_ratio_invalid_custom(self, mock_input, capsys):
+    def test_get_aspect_ratio_invalid_custom(self, feed_input, capsys):
         """Test invalid custom aspect ratio falls back to default."""
-        from change_aspect_ratio import get_aspect_ratio_input
+        feed_input(change_aspect_ratio, '6', 'invalid', 'also_invalid')
         width, height = get_aspect_ratio_input()
         assert width == 1920
         assert height == 1080
         captured = capsys.readouterr()
         assert "invalid" in captured.out.lower()
 
-    @patch('builtins.input', return_value='invalid')
-    def test_get_aspect_ratio_invalid_choice(self, mock_input, capsys):
+    def test_get_aspect_ratio_invalid_choice(self, feed_input, capsys):
         """Test invalid choice falls back to default."""
-        from change_aspect_ratio import get_aspect_ratio_input
+        feed_input(change_aspect_ratio, 'invalid')
         width, height = get_aspect_ratio_input()
         assert width == 1920
         assert height == 1080
         captured = capsys.readouterr()
         assert "invalid" in captured.out.lower()
 
-    @patch('builtins.input', return_value='1')
-    def test_get_mode_letterbox(self, mock_input):
+    def test_get_mode_letterbox(self, feed_input):
         """Test selecting letterbox mode."""
-        from change_aspect_ratio import get_mode_input
+        feed_input(change_aspect_ratio, '1')
         mode = get_mode_input()
         assert mode == AspectRatioMode.LETTERBOX
 
-    @patch('builtins.input', return_value='2')
-    def test_get_mode_crop(self, mock_input):
+    def test_get_mode_crop(self, feed_input):
         """Test selecting crop mode."""
-        from change_aspect_ratio import get_mode_input
+        feed_input(change_aspect_ratio, '2')
         mode = get_mode_input()
         assert mode == AspectRatioMode.CROP
 
-    @patch('builtins.input', return_value='1')
-    def test_get_anchor_center(self, mock_input):
+    def test_get_anchor_center(self, feed_input):
         """Test selecting center anchor."""
-        from change_aspect_ratio import get_anchor_input
+        feed_input(change_aspect_ratio, '1')
         anchor = get_anchor_input()
         assert anchor == CropAnchor.CENTER
 
-    @patch('builtins.input', return_value='2')
-    def test_get_anchor_upper_left(self, mock_input):
+    def test_get_anchor_upper_left(self, feed_input):
         """Test selecting upper left anchor."""
-        from change_aspect_ratio import get_anchor_input
+        feed_input(change_aspect_ratio, '2')
         anchor = get_anchor_input()
         assert anchor == CropAnchor.UPPER_LEFT
 
-    @patch('builtins.input', return_value='3')
-    def test_get_anchor_upper_center(self, mock_input):
+    def test_get_anchor_upper_center(self, feed_input):
         """Test selecting upper center anchor."""
-        from change_aspect_ratio import get_anchor_input
+        feed_input(change_aspect_ratio, '3')
         anchor = get_anchor_input()
         assert anchor == CropAnchor.UPPER_CENTER
 
-    @patch('builtins.input', return_value='4')
-    def test_get_anchor_upper_right(self, mock_input):
+    def test_get_anchor_upper_right(self, feed_input):
         """Test selecting upper right anchor."""
-        from change_aspect_ratio import get_anchor_input
+        feed_input(change_aspect_ratio, '4')
         anchor = get_anchor_input()
         assert anchor == CropAnchor.UPPER_RIGHT
 
-    @patch('builtins.input', return_value='5')
-    def test_get_anchor_center_left(self, mock_input):
+    def test_get_anchor_center_left(self, feed_input):
         """Test selecting center left anchor."""
-        from change_aspect_ratio import get_anchor_input
+        feed_input(change_aspect_ratio, '5')
         anchor = get_anchor_input()
         assert anchor == CropAnchor.CENTER_LEFT
 
-    @patch('builtins.input', return_value='6')
-    def test_get_anchor_center_right(self, mock_input):
+    def test_get_anchor_center_right(self, feed_input):
         """Test selecting center right anchor."""
-        from change_aspect_ratio import get_anchor_input
+        feed_input(change_aspect_ratio, '6')
         anchor = get_anchor_input()
         assert anchor == CropAnchor.CENTER_RIGHT
 
-    @patch('builtins.input', return_value='7')
-    def test_get_anchor_lower_left(self, mock_input):
+    def test_get_anchor_lower_left(self, feed_input):
         """Test selecting lower left anchor."""
-        from change_aspect_ratio import get_anchor_input
+        feed_input(change_aspect_ratio, '7')
         anchor = get_anchor_input()
         assert anchor == CropAnchor.LOWER_LEFT
 
-    @patch('builtins.input', return_value='8')
-    def test_get_anchor_lower_center(self, mock_input):
+    def test_get_anchor_lower_center(self, feed_input):
         """Test selecting lower center anchor."""
-        from change_aspect_ratio import get_anchor_input
+        feed_input(change_aspect_ratio, '8')
         anchor = get_anchor_input()
         assert anchor == CropAnchor.LOWER_CENTER
 
-    @patch('builtins.input', return_value='9')
-    def test_get_anchor_lower_right(self, mock_input):
+    def test_get_anchor_lower_right(self, feed_input):
         """Test selecting lower right anchor."""
-        from change_aspect_ratio import get_anchor_input
+        feed_input(change_aspect_ratio, '9')
         anchor = get_anchor_input()
         assert anchor == CropAnchor.LOWER_RIGHT
 
-    @patch('builtins.input', return_value='')
-    def test_get_anchor_default(self, mock_input):
+    def test_get_anchor_default(self, feed_input):
         """Test default anchor is center."""
-        from change_aspect_ratio import get_anchor_input
+        feed_input(change_aspect_ratio, '')
         anchor = get_anchor_input()
         assert anchor == CropAnchor.CENTER
 
-    @patch('builtins.input', return_value='1')
-    def test_get_letterbox_color_black(self, mock_input):
+    def test_get_letterbox_color_black(self, feed_input):
         """Test selecting black letterbox color."""
-        from change_aspect_ratio import get_letterbox_color_input
+        feed_input(change_aspect_ratio, '1')
         color = get_letterbox_color_input()
         assert color == (0, 0, 0)
 
-    @patch('builtins.input', return_value='2')
-    def test_get_letterbox_color_white(self, mock_input):
+    def test_get_letterbox_color_white(self, feed_input):
         """Test selecting white letterbox color."""
-        from change_aspect_ratio import get_letterbox_color_input
+        feed_input(change_aspect_ratio, '2')
         color = get_letterbox_color_input()
         assert color == (255, 255, 255)
 
-    @patch('builtins.input', return_value='3')
-    def test_get_letterbox_color_gray(self, mock_input):
+    def test_get_letterbox_color_gray(self, feed_input):
         """Test selecting gray letterbox color."""
-        from change_aspect_ratio import get_letterbox_color_input
+        feed_input(change_aspect_ratio, '3')
         color = get_letterbox_color_input()
         assert color == (128, 128, 128)
 
-    @patch('builtins.input', side_effect=['4', '255', '128', '64'])
-    def test_get_letterbox_color_custom(self, mock_input):
+    def test_get_letterbox_color_custom(self, feed_input):
         """Test custom RGB letterbox color."""
-        from change_aspect_ratio import get_letterbox_color_input
+        feed_input(change_aspect_ratio, '4', '255', '128', '64')
         color = get_letterbox_color_input()
         # Should return BGR format (64, 128, 255)
         assert color == (64, 128, 255)
 
-    @patch('builtins.input', side_effect=['4', '300', '128', '64'])
-    def test_get_letterbox_color_clamped(self, mock_input):
+    def test_get_letterbox_color_clamped(self, feed_input):
         """Test that custom color values are clamped to 0-255."""
-        from change_aspect_ratio import get_letterbox_color_input
+        feed_input(change_aspect_ratio, '4', '300', '128', '64')
         color = get_letterbox_color_input()
         # Red value 300 should be clamped to 255, result in BGR: (64, 128, 255)
         assert color == (64, 128, 255)
 
-    @patch('builtins.input', side_effect=['4', 'invalid', 'also_invalid', '0'])
-    def test_get_letterbox_color_invalid_custom(self, mock_input, capsys):
+    def test_get_letterbox_color_invalid_custom(self, feed_input, capsys):
         """Test invalid custom color falls back to black."""
-        from change_aspect_ratio import get_letterbox_color_input
+        feed_input(change_aspect_ratio, '4', 'invalid', 'also_invalid', '0')
         color = get_letterbox_color_input()
         assert color == (0, 0, 0)
         captured = capsys.readouterr()
         assert "invalid" in captured.out.lower()
 
-    @patch('builtins.input', return_value='')
-    def test_get_letterbox_color_default(self, mock_input):
+    def test_get_letterbox_color_default(self, feed_input):
         """Test default letterbox color is black."""
-        from change_aspect_ratio import get_letterbox_color_input
+        feed_input(change_aspect_ratio, '')
         color = get_letterbox_color_input()
         assert color == (0, 0, 0)
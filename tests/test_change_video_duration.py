@@ -1,21 +1,19 @@
 """Tests for change_video_duration module."""
 
-from pathlib import Path
-import sys
-from unittest.mock import patch
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+import change_video_duration
 from change_video_duration import (
     ensure_folder_exists,
     get_video_files,
     apply_fade,
+    get_fade_alpha,
+    create_video_with_duration,
     get_float_input,
     get_yes_no_input,
 )
 from constants import VIDEO_EXTENSIONS
+import cv2
 import numpy as np
+import pytest
 
 
 class TestEnsureFolderExists:
@@ -85,67 +83,264 @@ class TestGetVideoFiles:
         file_names = [f.name for f in files]
         assert file_names == sorted(file_names)
 
+    def test_limit_returns_first_sorted(self, temp_dir):
+        """Test that limit keeps only the first files in sorted order."""
+        for name in ("c", "a", "d", "b"):
+            (temp_dir / f"{name}.mp4").touch()
+
+        files = get_video_files(str(temp_dir), limit=2)
+        assert [f.name for f in files] == ["a.mp4", "b.mp4"]
+
 
 class TestApplyFade:
     """Test apply_fade function."""
 
+    @staticmethod
+    def _eq(result, expected):
+        """Assert byte-for-byte equality, with numpy's diff only on failure."""
+        if (
+            result.shape != expected.shape
+            or result.dtype != expected.dtype
+            or result.tobytes() != expected.tobytes()
+        ):
+            np.testing.assert_array_equal(result, expected)
+            assert result.dtype == expected.dtype
+
     def test_fade_full_opacity(self):
         """Test fade with alpha=1.0 (full opacity)."""
-        frame = np.ones((100, 100, 3), dtype=np.uint8) * 255
+        frame = np.full((100, 100, 3), 255, dtype=np.uint8)
         result = apply_fade(frame, 1.0)
-        np.testing.assert_array_equal(result, frame)
+        self._eq(result, frame)
 
     def test_fade_zero_opacity(self):
         """Test fade with alpha=0.0 (fully transparent)."""
-        frame = np.ones((100, 100, 3), dtype=np.uint8) * 255
+        frame = np.full((100, 100, 3), 255, dtype=np.uint8)
         result = apply_fade(frame, 0.0)
         expected = np.zeros((100, 100, 3), dtype=np.uint8)
-        np.testing.assert_array_equal(result, expected)
+        self._eq(result, expected)
 
     def test_fade_half_opacity(self):
         """Test fade with alpha=0.5 (half opacity)."""
-        frame = np.ones((100, 100, 3), dtype=np.uint8) * 200
+        frame = np.full((100, 100, 3), 200, dtype=np.uint8)
         result = apply_fade(frame, 0.5)
-        expected = np.ones((100, 100, 3), dtype=np.uint8) * 100
-        np.testing.assert_array_equal(result, expected)
+        expected = np.full((100, 100, 3), 100, dtype=np.uint8)
+        self._eq(result, expected)
 
     def test_fade_maintains_shape(self):
         """Test that fade maintains frame shape."""
-        frame = np.ones((480, 640, 3), dtype=np.uint8) * 128
+        frame = np.full((480, 640, 3), 128, dtype=np.uint8)
         result = apply_fade(frame, 0.7)
         assert result.shape == frame.shape
 
+    def test_fade_into_preallocated_buffer(self):
+        """Test fade writes into the provided output buffer."""
+        frame = np.full((100, 100, 3), 200, dtype=np.uint8)
+        out = np.empty_like(frame)
+        result = apply_fade(frame, 0.5, out=out)
+        assert result is out
+        self._eq(out, np.full((100, 100, 3), 100, dtype=np.uint8))
+
     def test_fade_output_dtype(self):
         """Test that output has correct dtype."""
-        frame = np.ones((100, 100, 3), dtype=np.uint8) * 255
+        frame = np.full((100, 100, 3), 255, dtype=np.uint8)
         result = apply_fade(frame, 0.5)
         assert result.dtype == np.uint8
 
 
+# The real writer, kept for building input videos while VideoWriter is patched
+_VideoWriter = cv2.VideoWriter
+
+
+def _write_video(path, frame_count, fps=10, width=64, height=48):
+    """Write a short mp4v video whose frames are distinct gray gradients."""
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    writer = _VideoWriter(str(path), fourcc, fps, (width, height))
+    ramp = np.linspace(0, 200, width, dtype=np.uint8)
+    for i in range(frame_count):
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+        frame[:] = (ramp + 5 * i)[None, :, None]
+        writer.write(frame)
+    writer.release()
+
+
+def _read_frames(path):
+    """Decode every frame of a video."""
+    cap = cv2.VideoCapture(str(path))
+    frames = []
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+class _RecordingWriter:
+    """VideoWriter stand-in that keeps a copy of every frame written."""
+
+    instances = []
+
+    def __init__(self, *args):
+        self.frames = []
+        _RecordingWriter.instances.append(self)
+
+    def write(self, frame):
+        # Copy now: output slots are reused once a frame has been written
+        self.frames.append(frame.copy())
+
+    def release(self):
+        pass
+
+
+@pytest.fixture
+def recorded_frames(monkeypatch):
+    """Capture the frames create_video_with_duration writes, in order."""
+    _RecordingWriter.instances = []
+    monkeypatch.setattr(change_video_duration.cv2, "VideoWriter", _RecordingWriter)
+
+    def frames():
+        (writer,) = _RecordingWriter.instances
+        return writer.frames
+
+    return frames
+
+
+class TestCreateVideoWithDuration:
+    """Test create_video_with_duration function."""
+
+    def test_fade_pixels_match_apply_fade(self, temp_dir, recorded_frames):
+        """Test every written frame equals apply_fade at its fade alpha."""
+        input_video = temp_dir / "input.mp4"
+        _write_video(input_video, 6)
+        source = _read_frames(input_video)
+
+        assert create_video_with_duration(
+            str(input_video),
+            str(temp_dir / "output.mp4"),
+            target_duration=2.0,
+            fade_duration=0.5,
+            apply_fades=True,
+        )
+
+        written = recorded_frames()
+        assert len(written) == 20
+        for frame_number, frame in enumerate(written):
+            alpha = get_fade_alpha(frame_number, 20, 5)
+            expected = apply_fade(source[frame_number % len(source)], alpha)
+            assert frame.tobytes() == expected.tobytes(), frame_number
+
+        # Fade in starts black, fade out ends dimmed, the middle is untouched
+        assert not written[0].any()
+        assert written[19].max() < source[19 % 6].max()
+        assert written[10].tobytes() == source[10 % 6].tobytes()
+
+    def test_frame_order_across_batches(self, temp_dir, recorded_frames, monkeypatch):
+        """Test frames rendered on several workers are written in order."""
+        monkeypatch.setattr(change_video_duration.os, "cpu_count", lambda: 4)
+        input_video = temp_dir / "input.mp4"
+        _write_video(input_video, 7)
+        source = _read_frames(input_video)
+
+        # Every frame fades, so all 30 go through the 4-slot pool
+        assert create_video_with_duration(
+            str(input_video),
+            str(temp_dir / "output.mp4"),
+            target_duration=3.0,
+            fade_duration=1.5,
+            apply_fades=True,
+        )
+
+        written = recorded_frames()
+        assert len(written) == 30
+        for frame_number, frame in enumerate(written):
+            alpha = get_fade_alpha(frame_number, 30, 15)
+            expected = apply_fade(source[frame_number % len(source)], alpha)
+            assert frame.tobytes() == expected.tobytes(), frame_number
+
+    def test_only_fade_frames_rendered(self, temp_dir, recorded_frames, monkeypatch):
+        """Test the frames between the fades are written without rendering."""
+        input_video = temp_dir / "input.mp4"
+        _write_video(input_video, 6)
+        rendered = []
+        fade_alpha = change_video_duration.get_fade_alpha
+
+        def record(frame_number, target_frames, fade_frames):
+            rendered.append(frame_number)
+            return fade_alpha(frame_number, target_frames, fade_frames)
+
+        monkeypatch.setattr(change_video_duration, "get_fade_alpha", record)
+
+        assert create_video_with_duration(
+            str(input_video),
+            str(temp_dir / "output.mp4"),
+            target_duration=2.0,
+            fade_duration=0.5,
+            apply_fades=True,
+        )
+
+        assert sorted(rendered) == [0, 1, 2, 3, 4, 15, 16, 17, 18, 19]
+        assert len(recorded_frames()) == 20
+
+    def test_without_fades_loops_source(self, temp_dir, recorded_frames):
+        """Test unfaded output repeats the source frames in order."""
+        input_video = temp_dir / "input.mp4"
+        _write_video(input_video, 4)
+        source = _read_frames(input_video)
+
+        assert create_video_with_duration(
+            str(input_video), str(temp_dir / "output.mp4"), target_duration=1.0
+        )
+
+        written = recorded_frames()
+        assert [f.tobytes() for f in written] == [
+            source[i % len(source)].tobytes() for i in range(10)
+        ]
+
+    def test_fade_worker_error_propagates(self, temp_dir, recorded_frames, monkeypatch):
+        """Test an exception raised while rendering a fade reaches the caller."""
+        input_video = temp_dir / "input.mp4"
+        _write_video(input_video, 4)
+
+        def fail(frame, alpha, out=None):
+            raise RuntimeError("fade failed")
+
+        monkeypatch.setattr(change_video_duration, "apply_fade", fail)
+
+        with pytest.raises(RuntimeError, match="fade failed"):
+            create_video_with_duration(
+                str(input_video),
+                str(temp_dir / "output.mp4"),
+                target_duration=1.0,
+                fade_duration=0.2,
+                apply_fades=True,
+            )
+
+
 class TestGetFloatInput:
     """Test get_float_input function."""
 
-    @patch('builtins.input', return_value='3.5')
-    def test_valid_float_input(self, mock_input):
+    def test_valid_float_input(self, feed_input):
         """Test valid float input."""
+        feed_input(change_video_duration, '3.5')
         result = get_float_input("Enter value: ", 2.0)
         assert result == 3.5
 
-    @patch('builtins.input', return_value='')
-    def test_empty_input_returns_default(self, mock_input):
+    def test_empty_input_returns_default(self, feed_input):
         """Test empty input returns default."""
+        feed_input(change_video_duration, '')
         result = get_float_input("Enter value: ", 2.0)
         assert result == 2.0
 
-    @patch('builtins.input', return_value='   ')
-    def test_whitespace_input_returns_default(self, mock_input):
+    def test_whitespace_input_returns_default(self, feed_input):
         """Test whitespace input returns default."""
+        feed_input(change_video_duration, '   ')
         result = get_float_input("Enter value: ", 2.0)
         assert result == 2.0
 
-    @patch('builtins.input', return_value='invalid')
-    def test_invalid_input_returns_default(self, mock_input, capsys):
+    def test_invalid_input_returns_default(self, feed_input, capsys):
         """Test invalid input returns default with warning."""
+        feed_input(change_video_duration, 'invalid')
         result = get_float_input("Enter value: ", 2.0)
         assert result == 2.0
         captured = capsys.readouterr()
@@ -155,44 +350,44 @@ class TestGetFloatInput:
 class TestGetYesNoInput:
     """Test get_yes_no_input function."""
 
-    @patch('builtins.input', return_value='y')
-    def test_yes_input(self, mock_input):
+    def test_yes_input(self, feed_input):
         """Test 'y' input returns True."""
+        feed_input(change_video_duration, 'y')
         result = get_yes_no_input("Continue? ", default=False)
         assert result is True
 
-    @patch('builtins.input', return_value='yes')
-    def test_yes_word_input(self, mock_input):
+    def test_yes_word_input(self, feed_input):
         """Test 'yes' input returns True."""
+        feed_input(change_video_duration, 'yes')
         result = get_yes_no_input("Continue? ", default=False)
         assert result is True
 
-    @patch('builtins.input', return_value='n')
-    def test_no_input(self, mock_input):
+    def test_no_input(self, feed_input):
         """Test 'n' input returns False."""
+        feed_input(change_video_duration, 'n')
         result = get_yes_no_input("Continue? ", default=True)
         assert result is False
 
-    @patch('builtins.input', return_value='')
-    def test_empty_input_returns_default_true(self, mock_input):
+    def test_empty_input_returns_default_true(self, feed_input):
         """Test empty input returns default True."""
+        feed_input(change_video_duration, '')
         result = get_yes_no_input("Continue? ", default=True)
         assert result is True
 
-    @patch('builtins.input', return_value='')
-    def test_empty_input_returns_default_false(self, mock_input):
+    def test_empty_input_returns_default_false(self, feed_input):
         """Test empty input returns default False."""
+        feed_input(change_video_duration, '')
         result = get_yes_no_input("Continue? ", default=False)
         assert result is False
 
-    @patch('builtins.input', return_value='1')
-    def test_one_input(self, mock_input):
+    def test_one_input(self, feed_input):
         """Test '1' input returns True."""
+        feed_input(change_video_duration, '1')
         result = get_yes_no_input("Continue? ", default=False)
         assert result is True
 
-    @patch('builtins.input', return_value='YES')
-    def test_case_insensitive(self, mock_input):
+    def test_case_insensitive(self, feed_input):
         """Test input is case insensitive."""
+        feed_input(change_video_duration, 'YES')
         result = get_yes_no_input("Continue? ", default=False)
         assert result is True
@@ -1,10 +1,6 @@
 """Tests for constants module."""
 
-from pathlib import Path
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from constants import (
     ImageFormat,
@@ -22,8 +18,24 @@ from constants import (
     is_video_file,
     supports_transparency,
     is_lossy_format,
+    DEFAULT_IMAGES_INPUT_DIR,
+    DEFAULT_IMAGES_OUTPUT_DIR,
+    DEFAULT_VIDEOS_INPUT_DIR,
+    DEFAULT_VIDEOS_OUTPUT_DIR,
+    DEFAULT_INPUT_FOLDER,
+    DEFAULT_OUTPUT_FOLDER,
+    DEFAULT_MAPPING_FILE,
+    DEFAULT_TARGET_DURATION,
+    DEFAULT_FADE_DURATION,
 )
 
+# One (use_case, format, quality) case per QUALITY_RECOMMENDATIONS entry
+_QUALITY_CASES = [
+    (use_case, format_name, quality)
+    for use_case, formats in QUALITY_RECOMMENDATIONS.items()
+    for format_name, quality in formats.items()
+]
+
 
 class TestImageFormat:
     """Test ImageFormat enum."""
@@ -114,11 +126,10 @@ class TestQualitySettings:
         assert "web" in QUALITY_RECOMMENDATIONS
         assert "archive" in QUALITY_RECOMMENDATIONS
 
-    def test_quality_recommendations_values(self):
+    @pytest.mark.parametrize("use_case, format_name, quality", _QUALITY_CASES)
+    def test_quality_recommendations_values(self, use_case, format_name, quality):
         """Test quality recommendation values are in valid range."""
-        for use_case, formats in QUALITY_RECOMMENDATIONS.items():
-            for format_name, quality in formats.items():
-                assert 0 <= quality <= 100, f"Quality {quality} out of range for {format_name} in {use_case}"
+        assert 0 <= quality <= 100
 
     def test_default_quality_fallback(self):
         """Test default quality fallback is valid."""
@@ -132,57 +143,66 @@ class TestQualitySettings:
 class TestHelperFunctions:
     """Test helper functions."""
 
-    def test_is_image_file_valid(self):
-        """Test is_image_file with valid image files."""
-        assert is_image_file("photo.jpg") is True
-        assert is_image_file("image.png") is True
-        assert is_image_file("graphic.webp") is True
-        assert is_image_file("animation.gif") is True
-
-    def test_is_image_file_invalid(self):
-        """Test is_image_file with non-image files."""
-        assert is_image_file("video.mp4") is False
-        assert is_image_file("document.pdf") is False
-        assert is_image_file("script.py") is False
-
-    def test_is_image_file_case_insensitive(self):
-        """Test is_image_file is case insensitive."""
-        assert is_image_file("PHOTO.JPG") is True
-        assert is_image_file("Image.PNG") is True
-
-    def test_is_video_file_valid(self):
-        """Test is_video_file with valid video files."""
-        assert is_video_file("clip.mp4") is True
-        assert is_video_file("movie.avi") is True
-        assert is_video_file("video.mov") is True
-
-    def test_is_video_file_invalid(self):
-        """Test is_video_file with non-video files."""
-        assert is_video_file("photo.jpg") is False
-        assert is_video_file("document.pdf") is False
-
-    def test_supports_transparency_true(self):
-        """Test supports_transparency with formats that support it."""
-        assert supports_transparency("PNG") is True
-        assert supports_transparency("WEBP") is True
-        assert supports_transparency("GIF") is True
-        assert supports_transparency("png") is True  # Case insensitive
-
-    def test_supports_transparency_false(self):
-        """Test supports_transparency with formats that don't support it."""
-        assert supports_transparency("JPEG") is False
-        assert supports_transparency("BMP") is False
-
-    def test_is_lossy_format_true(self):
-        """Test is_lossy_format with lossy formats."""
-        assert is_lossy_format("JPEG") is True
-        assert is_lossy_format("WEBP") is True
-        assert is_lossy_format("jpeg") is True  # Case insensitive
-
-    def test_is_lossy_format_false(self):
-        """Test is_lossy_format with lossless formats."""
-        assert is_lossy_format("PNG") is False
-        assert is_lossy_format("BMP") is False
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("photo.jpg", True),
+            ("image.png", True),
+            ("graphic.webp", True),
+            ("animation.gif", True),
+            ("PHOTO.JPG", True),  # Case insensitive
+            ("Image.PNG", True),
+            ("video.mp4", False),
+            ("document.pdf", False),
+            ("script.py", False),
+        ],
+    )
+    def test_is_image_file(self, filename, expected):
+        """Test is_image_file with image and non-image files."""
+        assert is_image_file(filename) == expected
+
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("clip.mp4", True),
+            ("movie.avi", True),
+            ("video.mov", True),
+            ("photo.jpg", False),
+            ("document.pdf", False),
+        ],
+    )
+    def test_is_video_file(self, filename, expected):
+        """Test is_video_file with video and non-video files."""
+        assert is_video_file(filename) == expected
+
+    @pytest.mark.parametrize(
+        "format_name, expected",
+        [
+            ("PNG", True),
+            ("WEBP", True),
+            ("GIF", True),
+            ("png", True),  # Case insensitive
+            ("JPEG", False),
+            ("BMP", False),
+        ],
+    )
+    def test_supports_transparency(self, format_name, expected):
+        """Test supports_transparency with formats with and without alpha."""
+        assert supports_transparency(format_name) == expected
+
+    @pytest.mark.parametrize(
+        "format_name, expected",
+        [
+            ("JPEG", True),
+            ("WEBP", True),
+            ("jpeg", True),  # Case insensitive
+            ("PNG", False),
+            ("BMP", False),
+        ],
+    )
+    def test_is_lossy_format(self, format_name, expected):
+        """Test is_lossy_format with lossy and lossless formats."""
+        assert is_lossy_format(format_name) == expected
 
 
 class TestDefaultValues:
@@ -190,12 +210,6 @@ class TestDefaultValues:
 
     def test_folder_defaults_exist(self):
         """Test that all default folder constants are defined."""
-        from constants import (
-            DEFAULT_IMAGES_INPUT_DIR,
-            DEFAULT_IMAGES_OUTPUT_DIR,
-            DEFAULT_VIDEOS_INPUT_DIR,
-            DEFAULT_VIDEOS_OUTPUT_DIR,
-        )
         assert DEFAULT_IMAGES_INPUT_DIR == "images_to_process"
         assert DEFAULT_IMAGES_OUTPUT_DIR == "images_processed"
         assert DEFAULT_VIDEOS_INPUT_DIR == "videos_to_process"
@@ -203,22 +217,11 @@ class TestDefaultValues:
 
     def test_legacy_aliases(self):
         """Test that legacy aliases point to correct values."""
-        from constants import (
-            DEFAULT_INPUT_FOLDER,
-            DEFAULT_OUTPUT_FOLDER,
-            DEFAULT_VIDEOS_INPUT_DIR,
-            DEFAULT_VIDEOS_OUTPUT_DIR,
-        )
         assert DEFAULT_INPUT_FOLDER == DEFAULT_VIDEOS_INPUT_DIR
         assert DEFAULT_OUTPUT_FOLDER == DEFAULT_VIDEOS_OUTPUT_DIR
 
     def test_video_defaults(self):
         """Test video processing defaults."""
-        from constants import (
-            DEFAULT_MAPPING_FILE,
-            DEFAULT_TARGET_DURATION,
-            DEFAULT_FADE_DURATION,
-        )
         assert DEFAULT_MAPPING_FILE == "video_mapping.txt"
         assert DEFAULT_TARGET_DURATION == 3.0
         assert DEFAULT_FADE_DURATION == 0.5
@@ -1,11 +1,6 @@
 """Tests for messages module."""
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from messages import (
     MessageType,
@@ -36,6 +31,7 @@ from messages import (
     output_saved_info,
     folder_created_info,
     folder_setup_instructions,
+    video_frame_progress_info,
 )
 
 
@@ -53,12 +49,13 @@ class TestMessageType:
 class TestMessageHandler:
     """Test MessageHandler class."""
 
-    @pytest.fixture
+    # Handlers hold no per-message state, so one instance serves the module
+    @pytest.fixture(scope="module")
     def handler(self):
         """Create MessageHandler for testing."""
         return MessageHandler(use_colors=False)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def colored_handler(self):
         """Create MessageHandler with colors for testing."""
         return MessageHandler(use_colors=True)
@@ -68,39 +65,42 @@ class TestMessageHandler:
         handler = MessageHandler(use_colors=False)
         assert handler.use_colors is False
 
-    def test_error_message(self, handler, capsys):
+    def test_error_message(self, handler):
         """Test error message output."""
-        handler.error("Test error")
-        captured = capsys.readouterr()
-        assert "ERROR" in captured.err
-        assert "Test error" in captured.err
+        line = handler.error("Test error")
+        assert "ERROR" in line
+        assert "Test error" in line
 
-    def test_success_message(self, handler, capsys):
+    def test_success_message(self, handler):
         """Test success message output."""
-        handler.success("Test success")
-        captured = capsys.readouterr()
-        assert "SUCCESS" in captured.out
-        assert "Test success" in captured.out
+        line = handler.success("Test success")
+        assert "SUCCESS" in line
+        assert "Test success" in line
 
-    def test_warning_message(self, handler, capsys):
+    def test_warning_message(self, handler):
         """Test warning message output."""
-        handler.warning("Test warning")
-        captured = capsys.readouterr()
-        assert "WARNING" in captured.out
-        assert "Test warning" in captured.out
+        line = handler.warning("Test warning")
+        assert "WARNING" in line
+        assert "Test warning" in line
 
-    def test_info_message(self, handler, capsys):
+    def test_info_message(self, handler):
         """Test info message output."""
-        handler.info("Test info")
-        captured = capsys.readouterr()
-        assert "INFO" in captured.out
-        assert "Test info" in captured.out
+        line = handler.info("Test info")
+        assert "INFO" in line
+        assert "Test info" in line
 
-    def test_custom_prefix(self, handler, capsys):
+    def test_custom_prefix(self, handler):
         """Test custom message prefix."""
-        handler.error("Test", prefix="CUSTOM")
+        line = handler.error("Test", prefix="CUSTOM")
+        assert "CUSTOM" in line
+
+    def test_output_streams(self, handler, capsys):
+        """Test errors go to stderr and other messages to stdout."""
+        error_line = handler.error("Test error")
+        info_line = handler.info("Test info")
         captured = capsys.readouterr()
-        assert "CUSTOM" in captured.err
+        assert captured.err == error_line + "\n"
+        assert captured.out == info_line + "\n"
 
 
 class TestExceptions:
@@ -196,6 +196,13 @@ class TestVideoProcessingMessages:
         assert "video.mp4" in msg
         assert "codec error" in msg
 
+    def test_video_frame_progress_info(self):
+        """Test frame progress names the video it belongs to."""
+        msg = video_frame_progress_info("clip.mp4", 30, 120, 25.0)
+        assert "clip.mp4" in msg
+        assert "30/120" in msg
+        assert "25.0%" in msg
+
     def test_folder_not_exist_error(self):
         """Test folder not exist error message."""
         msg = folder_not_exist_error("/path/to/folder")
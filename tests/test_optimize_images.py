@@ -0,0 +1,287 @@
+"""Tests for optimize_images module."""
+
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import optimize_images
+from optimize_images import (
+    OptimizeResult,
+    format_summary,
+    optimize_directory,
+    optimize_image,
+    select_resampling,
+)
+from constants import BILINEAR_MAX_SHRINK_RATIO
+
+
+@pytest.fixture
+def rgb_photo(tmp_path):
+    """Noisy 320x240 RGB PNG, so JPEG encoder settings affect the output."""
+    rng = np.random.default_rng(0)
+    path = tmp_path / "photo.png"
+    Image.fromarray(rng.integers(0, 256, (240, 320, 3), dtype=np.uint8)).save(path)
+    return path
+
+
+class TestJpegEncoding:
+    """Test the default and fast JPEG encoder paths."""
+
+    def test_default_is_progressive(self, rgb_photo, tmp_path):
+        """Test default JPEG output uses Pillow's progressive encoder."""
+        result = optimize_image(rgb_photo, tmp_path / "out.jpg", format="jpg")
+
+        with Image.open(result.path) as img:
+            assert img.format == "JPEG"
+            assert img.info.get("progressive")
+        assert result.optimized_size == result.path.stat().st_size
+
+    def test_default_ignores_simplejpeg(self, rgb_photo, tmp_path, monkeypatch):
+        """Test the default path never calls simplejpeg, even when installed."""
+
+        class NoEncode:
+            def encode_jpeg(self, *args, **kwargs):
+                raise AssertionError("simplejpeg used without fast_jpeg")
+
+        monkeypatch.setattr(optimize_images, "simplejpeg", NoEncode())
+
+        result = optimize_image(rgb_photo, tmp_path / "out.jpg", format="jpg")
+
+        assert result.path.exists()
+
+    def test_fast_jpeg_is_baseline(self, rgb_photo, tmp_path):
+        """Test fast_jpeg encodes a baseline JPEG with simplejpeg."""
+        pytest.importorskip("simplejpeg")
+
+        result = optimize_image(
+            rgb_photo, tmp_path / "out.jpg", format="jpg", fast_jpeg=True
+        )
+
+        with Image.open(result.path) as img:
+            assert img.format == "JPEG"
+            assert img.size == (320, 240)
+            assert not img.info.get("progressive")
+        assert result.optimized_size == result.path.stat().st_size
+
+    def test_fast_jpeg_without_simplejpeg(self, rgb_photo, tmp_path, monkeypatch):
+        """Test fast_jpeg falls back to Pillow when simplejpeg is missing."""
+        monkeypatch.setattr(optimize_images, "simplejpeg", None)
+
+        result = optimize_image(
+            rgb_photo, tmp_path / "out.jpg", format="jpg", fast_jpeg=True
+        )
+
+        with Image.open(result.path) as img:
+            assert img.info.get("progressive")
+
+
+class TestSelectResampling:
+    """Test select_resampling function."""
+
+    @pytest.mark.parametrize(
+        "width, height, expected",
+        [
+            (2000, 1000, Image.Resampling.BILINEAR),  # ratio ~1.04
+            (int(1920 * BILINEAR_MAX_SHRINK_RATIO) - 1, 1000, Image.Resampling.BILINEAR),
+            (int(1920 * BILINEAR_MAX_SHRINK_RATIO), 1000, Image.Resampling.LANCZOS),
+            (4000, 2000, Image.Resampling.LANCZOS),  # ratio ~2.08
+            (1000, 2000, Image.Resampling.LANCZOS),  # height drives the ratio
+        ],
+    )
+    def test_automatic_choice(self, width, height, expected):
+        """Test BILINEAR below BILINEAR_MAX_SHRINK_RATIO and LANCZOS from it up."""
+        img = Image.new("RGB", (width, height))
+        assert select_resampling(img, 1920, 1080) == expected
+
+    @pytest.mark.parametrize("name", ["nearest", "BICUBIC", "lanczos", "bilinear"])
+    def test_explicit_method_overrides(self, name):
+        """Test an explicit method is used regardless of the shrink ratio."""
+        img = Image.new("RGB", (2000, 1000))
+        assert select_resampling(img, 1920, 1080, name) == Image.Resampling[name.upper()]
+
+    def test_resample_flag_overrides(self, tmp_path, monkeypatch):
+        """Test --resample reaches the thumbnail call instead of the automatic choice."""
+        source = tmp_path / "wide.png"
+        Image.new("RGB", (2000, 1000)).save(source)  # Automatic choice: BILINEAR
+        used = []
+        thumbnail = Image.Image.thumbnail
+
+        def record(self, size, resample=Image.Resampling.BICUBIC, *args, **kwargs):
+            used.append(resample)
+            return thumbnail(self, size, resample, *args, **kwargs)
+
+        monkeypatch.setattr(Image.Image, "thumbnail", record)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["optimize_images.py", str(source), "-o", str(tmp_path / "out.png"),
+             "--resample", "nearest"],
+        )
+
+        optimize_images.main()
+
+        assert used == [Image.Resampling.NEAREST]
+        with Image.open(tmp_path / "out.png") as img:
+            assert img.size == (1920, 960)
+
+
+def _half_transparent(mode):
+    """400x200 image: left half fully transparent, right half opaque color."""
+    rgba = Image.new("RGBA", (400, 200), (0, 0, 0, 0))
+    rgba.paste((200, 30, 30, 255), (200, 0, 400, 200))
+    if mode == "RGBA":
+        return rgba
+    if mode == "LA":
+        return rgba.convert("LA")
+    # Palette image with a transparent index, as PNG/GIF files carry it
+    image = Image.new("P", (400, 200), 0)
+    image.putpalette([0, 0, 0, 200, 30, 30] + [0] * 762)
+    image.paste(1, (200, 0, 400, 200))
+    image.info["transparency"] = 0
+    return image
+
+
+class TestAlphaFlattening:
+    """Test transparent inputs saved as resized JPEGs."""
+
+    @pytest.mark.parametrize("mode", ["RGBA", "LA", "P"])
+    def test_transparent_input_to_jpeg(self, tmp_path, mode):
+        """Test output is RGB, thumbnail-sized and white where it was transparent."""
+        source = tmp_path / f"{mode}.png"
+        _half_transparent(mode).save(source)
+        with Image.open(source) as img:
+            assert img.mode == mode  # The PNG round trip keeps the mode
+
+        result = optimize_image(
+            source, tmp_path / "out.jpg", max_width=200, max_height=100, format="jpg"
+        )
+
+        assert result.dimensions == (200, 100)
+        with Image.open(result.path) as img:
+            assert img.format == "JPEG"
+            assert img.mode == "RGB"
+            assert img.size == (200, 100)
+            pixels = np.asarray(img, dtype=int)
+
+        # JPEG is lossy; compare away from the edge with a tolerance
+        assert (pixels[:, :80] >= 245).all()  # Transparent half became white
+        opaque = pixels[:, 120:].reshape(-1, 3).mean(axis=0)
+        expected = np.array([200, 30, 30])
+        if mode == "LA":
+            gray = Image.new("RGB", (1, 1), (200, 30, 30)).convert("L").getpixel((0, 0))
+            expected = np.full(3, gray)
+        np.testing.assert_allclose(opaque, expected, atol=8)
+
+
+class TestOptimizeResult:
+    """Test the OptimizeResult returned by optimize_image."""
+
+    def test_sizes_match_files(self, rgb_photo, tmp_path):
+        """Test reported sizes are the input and output file sizes in bytes."""
+        result = optimize_image(rgb_photo, tmp_path / "out.jpg", format="jpg")
+
+        assert isinstance(result, OptimizeResult)
+        assert result.path == tmp_path / "out.jpg"
+        assert result.original_size == rgb_photo.stat().st_size
+        assert result.optimized_size == result.path.stat().st_size
+
+    def test_resize_skipped_within_limits(self, rgb_photo, tmp_path):
+        """Test dimensions stay None when the image already fits."""
+        result = optimize_image(rgb_photo, tmp_path / "out.jpg", format="jpg")
+
+        assert result.dimensions is None
+
+    def test_resized_dimensions(self, rgb_photo, tmp_path):
+        """Test dimensions report the new size when the image was shrunk."""
+        result = optimize_image(
+            rgb_photo, tmp_path / "out.jpg", max_width=160, max_height=160, format="jpg"
+        )
+
+        assert result.dimensions == (160, 120)
+        with Image.open(result.path) as img:
+            assert img.size == (160, 120)
+
+    def test_default_output_path(self, rgb_photo):
+        """Test the output lands next to the input with an _optimized suffix."""
+        result = optimize_image(rgb_photo)
+
+        assert result.path == rgb_photo.parent / "photo_optimized.png"
+        assert result.path.exists()
+
+    def test_missing_input_fails(self, tmp_path):
+        """Test a missing input raises instead of returning a result."""
+        with pytest.raises(FileNotFoundError):
+            optimize_image(tmp_path / "missing.jpg")
+
+
+class TestFormatSummary:
+    """Test format_summary and the batch summary printed by optimize_directory."""
+
+    TOTAL_ROW = re.compile(r"^  Total\s+([\d.]+) KB\s+([\d.]+) KB\s+(-?[\d.]+)%  (\d+)/(\d+)$")
+
+    def test_totals_match_rows(self):
+        """Test the totals row sums the per-file sizes and counts resizes."""
+        results = [
+            OptimizeResult(Path("a.jpg"), 4096, 1024, (800, 600)),
+            OptimizeResult(Path("b.png"), 2048, 2048, None),
+            OptimizeResult(Path("c.webp"), 1024, 512, (640, 480)),
+        ]
+
+        lines = format_summary(results, []).splitlines()
+
+        assert len(lines) == 1 + len(results) + 1  # Header, rows, totals
+        match = self.TOTAL_ROW.match(lines[-1])
+        assert match is not None
+        assert float(match.group(1)) == pytest.approx(7168 / 1024, abs=0.005)
+        assert float(match.group(2)) == pytest.approx(3584 / 1024, abs=0.005)
+        assert float(match.group(3)) == pytest.approx(-50.0, abs=0.05)
+        assert match.group(4, 5) == ("2", "3")
+
+    def test_failures_listed_after_totals(self):
+        """Test failed files get their own rows and are left out of the totals."""
+        results = [OptimizeResult(Path("a.jpg"), 2048, 1024, None)]
+
+        lines = format_summary(results, [("bad.jpg", "cannot identify image")]).splitlines()
+
+        assert self.TOTAL_ROW.match(lines[-2]).group(4, 5) == ("0", "1")
+        assert lines[-1].split() == ["bad.jpg", "FAILED:", "cannot", "identify", "image"]
+
+    def test_only_failures_has_no_totals(self):
+        """Test a batch with no successes prints no totals row."""
+        lines = format_summary([], [("bad.jpg", "boom")]).splitlines()
+
+        assert len(lines) == 2
+        assert not any(self.TOTAL_ROW.match(line) for line in lines)
+
+    def test_directory_summary(self, rgb_photo, tmp_path, capsys):
+        """Test optimize_directory prints per-file rows, totals and failures."""
+        (tmp_path / "broken.jpg").write_bytes(b"not an image")
+        output_dir = tmp_path / "out"
+
+        optimize_directory(tmp_path, output_dir, format="jpg")
+
+        out = capsys.readouterr().out
+        rows = {line.split()[0]: line for line in out.splitlines() if line.startswith("  ")}
+        assert "FAILED" in rows["broken.jpg"]
+        total = self.TOTAL_ROW.match(rows["Total"])
+        assert total.group(4, 5) == ("0", "1")
+        assert float(total.group(1)) == pytest.approx(
+            rgb_photo.stat().st_size / 1024, abs=0.005
+        )
+        assert float(total.group(2)) == pytest.approx(
+            (output_dir / "photo.jpg").stat().st_size / 1024, abs=0.005
+        )
+
+    def test_directory_outputs_use_format_extension(self, rgb_photo, tmp_path):
+        """Test converted outputs are named after the chosen format."""
+        output_dir = tmp_path / "out"
+
+        optimize_directory(tmp_path, output_dir, format="jpg")
+
+        assert [f.name for f in output_dir.iterdir()] == ["photo.jpg"]
+        with Image.open(output_dir / "photo.jpg") as img:
+            assert img.format == "JPEG"
@@ -1,14 +1,15 @@
 """Tests for text_to_image module."""
 
+import io
+
 import pytest
-from pathlib import Path
 from PIL import Image, ImageFont
-import tempfile
-import shutil
 
+import text_to_image
 from text_to_image import (
     get_default_font,
     create_text_image,
+    make_line_encoder,
     process_text_file,
     DEFAULT_FONT_SIZE,
     DEFAULT_TEXT_COLOR,
@@ -49,117 +50,124 @@ class TestGetDefaultFont:
 class TestCreateTextImage:
     """Test create_text_image function."""
 
-    def test_creates_image_with_correct_dimensions(self):
+    def test_creates_image_with_correct_dimensions(self, default_font):
         """Test that created image has correct dimensions."""
         width, height = 800, 600
-        font = get_default_font(DEFAULT_FONT_SIZE)
 
-        img = create_text_image("Test", width, height, font)
+        img = create_text_image("Test", width, height, default_font)
 
         assert isinstance(img, Image.Image)
         assert img.size == (width, height)
 
-    def test_creates_image_with_default_colors(self):
+    def test_creates_image_with_default_colors(self, default_font):
         """Test image creation with default colors."""
         width, height = 800, 600
-        font = get_default_font(DEFAULT_FONT_SIZE)
 
         img = create_text_image(
-            "Test", width, height, font, DEFAULT_TEXT_COLOR, DEFAULT_BG_COLOR
+            "Test", width, height, default_font, DEFAULT_TEXT_COLOR, DEFAULT_BG_COLOR
         )
 
         # Check background color (sample from corner)
         pixel = img.getpixel((0, 0))
         assert pixel == DEFAULT_BG_COLOR
 
-    def test_creates_image_with_custom_colors(self):
+    def test_creates_image_with_custom_colors(self, default_font):
         """Test image creation with custom colors."""
         width, height = 800, 600
-        font = get_default_font(DEFAULT_FONT_SIZE)
         custom_bg = (100, 150, 200)
 
-        img = create_text_image("Test", width, height, font, bg_color=custom_bg)
+        img = create_text_image("Test", width, height, default_font, bg_color=custom_bg)
 
         # Check custom background color
         pixel = img.getpixel((0, 0))
         assert pixel == custom_bg
 
-    def test_empty_text(self):
+    def test_empty_text(self, default_font):
         """Test creating image with empty text."""
         width, height = 800, 600
-        font = get_default_font(DEFAULT_FONT_SIZE)
 
-        img = create_text_image("", width, height, font)
+        img = create_text_image("", width, height, default_font)
 
         assert img.size == (width, height)
 
-    def test_long_text(self):
+    def test_long_text(self, default_font):
         """Test creating image with very long text."""
         width, height = 800, 600
-        font = get_default_font(DEFAULT_FONT_SIZE)
         long_text = "This is a very long text that might not fit in the image"
 
-        img = create_text_image(long_text, width, height, font)
+        img = create_text_image(long_text, width, height, default_font)
 
         assert img.size == (width, height)
 
-    def test_unicode_text(self):
+    def test_unicode_text(self, default_font):
         """Test creating image with Unicode characters."""
         width, height = 800, 600
-        font = get_default_font(DEFAULT_FONT_SIZE)
         unicode_text = "Hello 世界 🌍"
 
-        img = create_text_image(unicode_text, width, height, font)
+        img = create_text_image(unicode_text, width, height, default_font)
 
         assert img.size == (width, height)
 
-    def test_custom_padding(self):
+    def test_custom_padding(self, default_font):
         """Test image creation with custom padding."""
         width, height = 800, 600
-        font = get_default_font(DEFAULT_FONT_SIZE)
         custom_padding = 50
 
-        img = create_text_image("Test", width, height, font, padding=custom_padding)
+        img = create_text_image("Test", width, height, default_font, padding=custom_padding)
 
         assert img.size == (width, height)
 
-    def test_different_aspect_ratios(self):
+    def test_different_aspect_ratios(self, default_font):
         """Test creating images with different aspect ratios."""
-        font = get_default_font(DEFAULT_FONT_SIZE)
-
         # 16:9
-        img_16_9 = create_text_image("Test", *ASPECT_RATIO_16_9, font)
+        img_16_9 = create_text_image("Test", *ASPECT_RATIO_16_9, default_font)
         assert img_16_9.size == ASPECT_RATIO_16_9
 
         # 1:1 (Square)
-        img_1_1 = create_text_image("Test", *ASPECT_RATIO_1_1, font)
+        img_1_1 = create_text_image("Test", *ASPECT_RATIO_1_1, default_font)
         assert img_1_1.size == ASPECT_RATIO_1_1
 
 
+class TestMakeLineEncoder:
+    """Test make_line_encoder function."""
+
+    def test_matches_create_text_image(self, default_font):
+        """Test encoded PNG decodes to the same pixels as create_text_image."""
+        encode = make_line_encoder(400, 300, default_font, (255, 0, 0), (0, 0, 255))
+
+        with Image.open(io.BytesIO(encode("Hello"))) as img:
+            assert img.format == "PNG"
+            assert img.size == (400, 300)
+            expected = create_text_image(
+                "Hello", 400, 300, default_font, (255, 0, 0), (0, 0, 255)
+            )
+            assert img.convert("RGB").tobytes() == expected.tobytes()
+
+    def test_format_name_is_case_insensitive(self, default_font):
+        """Test lower-case format names select the matching encoder."""
+        encode = make_line_encoder(400, 300, default_font, output_format="jpg")
+
+        with Image.open(io.BytesIO(encode("Hello"))) as img:
+            assert img.format == "JPEG"
+
+
 class TestProcessTextFile:
     """Test process_text_file function."""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        temp_path = Path(tempfile.mkdtemp())
-        yield temp_path
-        shutil.rmtree(temp_path)
-
-    @pytest.fixture
-    def sample_text_file(self, temp_dir):
+    def sample_text_file(self, tmp_path):
         """Create a sample text file."""
-        text_file = temp_dir / "test.txt"
+        text_file = tmp_path / "test.txt"
         text_file.write_text("Line 1\nLine 2\nLine 3\n")
         return text_file
 
-    def test_process_nonexistent_file(self, temp_dir):
+    def test_process_nonexistent_file(self, tmp_path):
         """Test processing a file that doesn't exist."""
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         output_dir.mkdir()
 
         count = process_text_file(
-            str(temp_dir / "nonexistent.txt"),
+            str(tmp_path / "nonexistent.txt"),
             str(output_dir),
             800,
             600,
@@ -167,11 +175,11 @@ class TestProcessTextFile:
 
         assert count == 0
 
-    def test_process_empty_file(self, temp_dir):
+    def test_process_empty_file(self, tmp_path):
         """Test processing an empty file."""
-        text_file = temp_dir / "empty.txt"
+        text_file = tmp_path / "empty.txt"
         text_file.write_text("")
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         output_dir.mkdir()
 
         count = process_text_file(
@@ -183,11 +191,11 @@ class TestProcessTextFile:
 
         assert count == 0
 
-    def test_process_file_with_only_whitespace(self, temp_dir):
+    def test_process_file_with_only_whitespace(self, tmp_path):
         """Test processing a file with only whitespace."""
-        text_file = temp_dir / "whitespace.txt"
+        text_file = tmp_path / "whitespace.txt"
         text_file.write_text("   \n\n  \n")
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         output_dir.mkdir()
 
         count = process_text_file(
@@ -199,9 +207,9 @@ class TestProcessTextFile:
 
         assert count == 0
 
-    def test_process_valid_text_file(self, sample_text_file, temp_dir):
+    def test_process_valid_text_file(self, sample_text_file, tmp_path):
         """Test processing a valid text file."""
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         count = process_text_file(
             str(sample_text_file),
@@ -217,9 +225,9 @@ class TestProcessTextFile:
         output_files = list(output_dir.glob("*.png"))
         assert len(output_files) == 3
 
-    def test_process_file_creates_output_folder(self, sample_text_file, temp_dir):
+    def test_process_file_creates_output_folder(self, sample_text_file, tmp_path):
         """Test that process_text_file creates output folder if it doesn't exist."""
-        output_dir = temp_dir / "new_output"
+        output_dir = tmp_path / "new_output"
         assert not output_dir.exists()
 
         count = process_text_file(
@@ -232,9 +240,9 @@ class TestProcessTextFile:
         assert count == 3
         assert output_dir.exists()
 
-    def test_output_filenames(self, sample_text_file, temp_dir):
+    def test_output_filenames(self, sample_text_file, tmp_path):
         """Test that output filenames are correctly formatted."""
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         process_text_file(
             str(sample_text_file),
@@ -251,9 +259,9 @@ class TestProcessTextFile:
         assert "line_002" in output_files[1].name
         assert "line_003" in output_files[2].name
 
-    def test_different_output_formats(self, sample_text_file, temp_dir):
+    def test_different_output_formats(self, sample_text_file, tmp_path):
         """Test creating images in different formats."""
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         # Test JPEG
         count_jpeg = process_text_file(
@@ -279,9 +287,9 @@ class TestProcessTextFile:
         webp_files = list((output_dir / "webp").glob("*.webp"))
         assert len(webp_files) == 3
 
-    def test_custom_colors(self, sample_text_file, temp_dir):
+    def test_custom_colors(self, sample_text_file, tmp_path):
         """Test processing with custom colors."""
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         custom_text_color = (255, 0, 0)  # Red
         custom_bg_color = (0, 0, 255)  # Blue
 
@@ -301,9 +309,9 @@ class TestProcessTextFile:
         pixel = img.getpixel((0, 0))
         assert pixel == custom_bg_color
 
-    def test_custom_font_size(self, sample_text_file, temp_dir):
+    def test_custom_font_size(self, sample_text_file, tmp_path):
         """Test processing with custom font size."""
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         custom_font_size = 72
 
         count = process_text_file(
@@ -316,9 +324,9 @@ class TestProcessTextFile:
 
         assert count == 3
 
-    def test_custom_dimensions(self, sample_text_file, temp_dir):
+    def test_custom_dimensions(self, sample_text_file, tmp_path):
         """Test processing with custom dimensions."""
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         width, height = 1920, 1080
 
         process_text_file(
@@ -332,11 +340,11 @@ class TestProcessTextFile:
         img = Image.open(list(output_dir.glob("*.png"))[0])
         assert img.size == (width, height)
 
-    def test_special_characters_in_text(self, temp_dir):
+    def test_special_characters_in_text(self, tmp_path):
         """Test processing text with special characters."""
-        text_file = temp_dir / "special.txt"
+        text_file = tmp_path / "special.txt"
         text_file.write_text("Hello/World\nTest*File\nSpecial#Characters\n")
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         count = process_text_file(
             str(text_file),
@@ -354,12 +362,12 @@ class TestProcessTextFile:
             assert "/" not in file.name
             assert "*" not in file.name
 
-    def test_very_long_text_line(self, temp_dir, capfd):
+    def test_very_long_text_line(self, tmp_path, capfd):
         """Test processing a very long text line."""
-        text_file = temp_dir / "long.txt"
+        text_file = tmp_path / "long.txt"
         long_line = "A" * 200  # Very long line
         text_file.write_text(long_line)
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         count = process_text_file(
             str(text_file),
@@ -378,11 +386,11 @@ class TestProcessTextFile:
         captured = capfd.readouterr()
         assert "too long for filename" in captured.out or "too long for filename" in captured.err
 
-    def test_unicode_text_in_file(self, temp_dir):
+    def test_unicode_text_in_file(self, tmp_path):
         """Test processing text file with Unicode characters."""
-        text_file = temp_dir / "unicode.txt"
+        text_file = tmp_path / "unicode.txt"
         text_file.write_text("Hello 世界\nBonjour 🌍\nПривет\n", encoding="utf-8")
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         count = process_text_file(
             str(text_file),
@@ -393,11 +401,11 @@ class TestProcessTextFile:
 
         assert count == 3
 
-    def test_mixed_empty_and_valid_lines(self, temp_dir):
+    def test_mixed_empty_and_valid_lines(self, tmp_path):
         """Test processing file with mix of empty and valid lines."""
-        text_file = temp_dir / "mixed.txt"
+        text_file = tmp_path / "mixed.txt"
         text_file.write_text("Line 1\n\nLine 2\n   \nLine 3\n")
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         count = process_text_file(
             str(text_file),
@@ -409,9 +417,9 @@ class TestProcessTextFile:
         # Should only process non-empty lines
         assert count == 3
 
-    def test_custom_padding(self, sample_text_file, temp_dir):
+    def test_custom_padding(self, sample_text_file, tmp_path):
         """Test processing with custom padding."""
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         custom_padding = 50
 
         count = process_text_file(
@@ -428,18 +436,11 @@ class TestProcessTextFile:
 class TestImageVerification:
     """Test that created images are valid and readable."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        temp_path = Path(tempfile.mkdtemp())
-        yield temp_path
-        shutil.rmtree(temp_path)
-
-    def test_created_images_are_valid(self, temp_dir):
+    def test_created_images_are_valid(self, tmp_path):
         """Test that created images can be opened and read."""
-        text_file = temp_dir / "test.txt"
+        text_file = tmp_path / "test.txt"
         text_file.write_text("Test Image")
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         process_text_file(
             str(text_file),
@@ -455,11 +456,11 @@ class TestImageVerification:
             assert img.mode == "RGB"
             img.verify()  # Verify image integrity
 
-    def test_jpeg_images_have_no_alpha(self, temp_dir):
+    def test_jpeg_images_have_no_alpha(self, tmp_path):
         """Test that JPEG images don't have alpha channel."""
-        text_file = temp_dir / "test.txt"
+        text_file = tmp_path / "test.txt"
         text_file.write_text("Test JPEG")
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         process_text_file(
             str(text_file),
@@ -473,22 +474,72 @@ class TestImageVerification:
         img = Image.open(img_file)
         assert img.mode == "RGB"  # JPEG should be RGB, not RGBA
 
+    def test_jpg_alias_saves_jpeg(self, tmp_path):
+        """Test that the JPG format name is saved with the JPEG encoder."""
+        text_file = tmp_path / "test.txt"
+        text_file.write_text("Test JPG")
+        output_dir = tmp_path / "output"
+
+        count = process_text_file(
+            str(text_file),
+            str(output_dir),
+            800,
+            600,
+            output_format=ImageFormat.JPG.value,
+        )
+
+        assert count == 1
+        img = Image.open(list(output_dir.glob("*.jpg"))[0])
+        assert img.format == "JPEG"
+
+    def test_webp_images_are_lossless(self, tmp_path, default_font):
+        """Test that WEBP output matches the rendered pixels exactly."""
+        text_file = tmp_path / "test.txt"
+        text_file.write_text("Test WEBP")
+        output_dir = tmp_path / "output"
+
+        process_text_file(
+            str(text_file),
+            str(output_dir),
+            800,
+            600,
+            font=default_font,
+            output_format=ImageFormat.WEBP.value,
+        )
+
+        expected = create_text_image("Test WEBP", 800, 600, default_font)
+        with Image.open(list(output_dir.glob("*.webp"))[0]) as img:
+            assert img.convert("RGB").tobytes() == expected.tobytes()
+
+    def test_bmp_images_are_uncompressed(self, tmp_path):
+        """Test that BMP output is written as uncompressed RGB."""
+        text_file = tmp_path / "test.txt"
+        text_file.write_text("Test BMP")
+        output_dir = tmp_path / "output"
+
+        process_text_file(
+            str(text_file),
+            str(output_dir),
+            800,
+            600,
+            output_format=ImageFormat.BMP.value,
+        )
+
+        img_file = list(output_dir.glob("*.bmp"))[0]
+        img = Image.open(img_file)
+        assert img.format == "BMP"
+        assert img.mode == "RGB"
+        assert img.size == (800, 600)
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        temp_path = Path(tempfile.mkdtemp())
-        yield temp_path
-        shutil.rmtree(temp_path)
-
-    def test_very_small_dimensions(self, temp_dir):
+    def test_very_small_dimensions(self, tmp_path):
         """Test creating images with very small dimensions."""
-        text_file = temp_dir / "test.txt"
+        text_file = tmp_path / "test.txt"
         text_file.write_text("Test")
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         count = process_text_file(
             str(text_file),
@@ -501,11 +552,11 @@ class TestEdgeCases:
         img = Image.open(list(output_dir.glob("*.png"))[0])
         assert img.size == (10, 10)
 
-    def test_very_large_dimensions(self, temp_dir):
+    def test_very_large_dimensions(self, tmp_path):
         """Test creating images with large dimensions."""
-        text_file = temp_dir / "test.txt"
+        text_file = tmp_path / "test.txt"
         text_file.write_text("Test")
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         count = process_text_file(
             str(text_file),
@@ -518,11 +569,11 @@ class TestEdgeCases:
         img = Image.open(list(output_dir.glob("*.png"))[0])
         assert img.size == (3840, 2160)
 
-    def test_single_line_file(self, temp_dir):
+    def test_single_line_file(self, tmp_path):
         """Test processing file with single line."""
-        text_file = temp_dir / "single.txt"
+        text_file = tmp_path / "single.txt"
         text_file.write_text("Single Line")
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         count = process_text_file(
             str(text_file),
@@ -534,12 +585,12 @@ class TestEdgeCases:
         assert count == 1
         assert len(list(output_dir.glob("*.png"))) == 1
 
-    def test_many_lines_file(self, temp_dir):
+    def test_many_lines_file(self, tmp_path):
         """Test processing file with many lines."""
-        text_file = temp_dir / "many.txt"
+        text_file = tmp_path / "many.txt"
         lines = [f"Line {i}" for i in range(1, 101)]  # 100 lines
         text_file.write_text("\n".join(lines))
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         count = process_text_file(
             str(text_file),
@@ -550,3 +601,70 @@ class TestEdgeCases:
 
         assert count == 100
         assert len(list(output_dir.glob("*.png"))) == 100
+
+    def test_few_lines_skip_process_pool(self, tmp_path, default_font, monkeypatch):
+        """Test files below DEFAULT_MIN_PROCESS_LINES render without a process pool."""
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started for a short file")
+
+        monkeypatch.setattr(text_to_image, "ProcessPoolExecutor", no_pool)
+        text_file = tmp_path / "short.txt"
+        text_file.write_text("\n".join(f"Line {i}" for i in range(8)))
+
+        count = process_text_file(
+            str(text_file), str(tmp_path / "output"), 400, 300, font=default_font
+        )
+
+        assert count == 8
+
+    def test_in_process_rendering(self, tmp_path):
+        """Test the in-process path used for fonts that cannot go to workers."""
+        text_file = tmp_path / "serial.txt"
+        text_file.write_text("First\nSecond\nThird")
+        output_dir = tmp_path / "output"
+
+        count = process_text_file(
+            str(text_file),
+            str(output_dir),
+            400,
+            300,
+            font=ImageFont.load_default(),
+        )
+
+        assert count == 3
+        files = sorted(output_dir.glob("*.png"))
+        assert [f.name for f in files] == [
+            "line_001_First.png",
+            "line_002_Second.png",
+            "line_003_Third.png",
+        ]
+        for f in files:
+            with Image.open(f) as img:
+                assert img.size == (400, 300)
+
+    def test_repeated_lines(self, tmp_path):
+        """Test that repeated lines each get their own identical image."""
+        text_file = tmp_path / "repeated.txt"
+        text_file.write_text("Again\nOnce\nAgain\nAgain")
+        output_dir = tmp_path / "output"
+
+        count = process_text_file(
+            str(text_file),
+            str(output_dir),
+            400,
+            300,
+        )
+
+        assert count == 4
+        files = sorted(output_dir.glob("*.png"))
+        assert [f.name for f in files] == [
+            "line_001_Again.png",
+            "line_002_Once.png",
+            "line_003_Again.png",
+            "line_004_Again.png",
+        ]
+        first = files[0].read_bytes()
+        assert files[2].read_bytes() == first
+        assert files[3].read_bytes() == first
+        assert files[1].read_bytes() != first
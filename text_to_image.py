@@ -6,9 +6,14 @@ font, size, aspect ratio, and dimensions.
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Optional, Union
+from typing import Callable, Dict, List, Tuple, Optional, Union
+import io
 import os
+import re
+import shutil
 
 from constants import (
     ASPECT_RATIO_16_9,
@@ -21,7 +26,6 @@ from constants import (
 )
 from messages import (
     msg,
-    processing_started,
     file_created,
     batch_started,
     batch_completed,
@@ -41,12 +45,39 @@ DEFAULT_TEXT_COLOR = (255, 255, 255)  # White
 DEFAULT_BG_COLOR = (0, 0, 0)  # Black
 DEFAULT_FORMAT = ImageFormat.PNG.value
 DEFAULT_PADDING = 20  # Padding around text
+DEFAULT_PNG_COMPRESS_LEVEL = 1  # Fast zlib; flat text images still compress well
+# Lossless WebP at low effort: text on a flat background encodes faster
+# and smaller than with the default lossy encoder
+DEFAULT_WEBP_METHOD = 1
+DEFAULT_WEBP_EFFORT = 0  # Pillow's "quality" option in lossless mode
+DEFAULT_WRITE_THREADS = 2  # File writes overlapped with encoding on the serial path
+DEFAULT_MIN_PROCESS_LINES = 64  # Below this, process start-up outweighs the speedup
+MAX_FILENAME_TEXT_LENGTH = 50  # Characters of line text kept in output filenames
+
+
+# Output format names that are saved with the JPEG encoder
+_JPEG_FORMATS = frozenset({'JPEG', 'JPG'})
+
+# Candidate system fonts, in order of preference
+_FONT_PATHS = (
+    "/System/Library/Fonts/Helvetica.ttc",  # macOS
+    "/System/Library/Fonts/SFNSDisplay.ttf",  # macOS
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
+    "C:\\Windows\\Fonts\\arial.ttf",  # Windows
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",  # Linux
+)
+
+# Scanned once at import rather than on every font lookup
+_AVAILABLE_FONT_PATHS = tuple(path for path in _FONT_PATHS if os.path.exists(path))
 
 
+@lru_cache(maxsize=None)
 def get_default_font(size: int) -> Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]:
     """
     Get a default system font.
 
+    Fonts are cached per size, so the font file is only parsed once.
+
     Args:
         size: Font size
 
@@ -54,25 +85,24 @@ def get_default_font(size: int) -> Union[ImageFont.FreeTypeFont, ImageFont.Image
         ImageFont object
     """
     # Try to get a decent system font
-    font_paths = [
-        "/System/Library/Fonts/Helvetica.ttc",  # macOS
-        "/System/Library/Fonts/SFNSDisplay.ttf",  # macOS
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
-        "C:\\Windows\\Fonts\\arial.ttf",  # Windows
-        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",  # Linux
-    ]
-
-    for font_path in font_paths:
-        if os.path.exists(font_path):
-            try:
-                return ImageFont.truetype(font_path, size)
-            except Exception:
-                continue
+    for font_path in _AVAILABLE_FONT_PATHS:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except Exception:
+            continue
 
     # Fallback to default font
     return ImageFont.load_default()
 
 
+@lru_cache(maxsize=4096)
+def _measure_text(
+    text: str, font: Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]
+) -> Tuple[float, float, float, float]:
+    """Bounding box of a single line of text, cached per (text, font)."""
+    return font.getbbox(text)
+
+
 def create_text_image(
     text: str,
     width: int,
@@ -102,7 +132,7 @@ def create_text_image(
     draw = ImageDraw.Draw(image)
 
     # Get text bounding box for proper centering
-    bbox = draw.textbbox((0, 0), text, font=font)
+    bbox = _measure_text(text, font)
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
 
@@ -124,6 +154,147 @@ def create_text_image(
     return image
 
 
+# Anything other than letters, digits, space, underscore or hyphen
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w -]")
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_filename(text: str) -> str:
+    """Replace each character that is unsafe in a filename with an underscore."""
+    return _UNSAFE_FILENAME_CHARS.sub("_", text)
+
+
+def make_line_encoder(
+    width: int,
+    height: int,
+    font: Union[ImageFont.FreeTypeFont, ImageFont.ImageFont],
+    text_color: Tuple[int, int, int] = DEFAULT_TEXT_COLOR,
+    bg_color: Tuple[int, int, int] = DEFAULT_BG_COLOR,
+    output_format: str = DEFAULT_FORMAT,
+    padding: int = DEFAULT_PADDING,
+    compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
+) -> Callable[[str], memoryview]:
+    """
+    Build a function that renders one line of text and encodes it.
+
+    The encoder and its options are resolved here, so the returned
+    function only draws and saves. Build it once per text file and call
+    it for every line.
+
+    Args:
+        width: Image width
+        height: Image height
+        font: Font to use
+        text_color: RGB text color
+        bg_color: RGB background color
+        output_format: Image format (PNG, JPEG, etc.)
+        padding: Padding around text (pixels)
+        compress_level: PNG zlib compression level (0-9)
+
+    Returns:
+        Function mapping a line of text to its encoded image bytes
+    """
+    output_format = output_format.upper()
+    save_options: dict = {}
+    if output_format in _JPEG_FORMATS:
+        # create_text_image always builds RGB, so JPEG needs no conversion.
+        # Pillow only registers the name "JPEG", so "JPG" is saved under it.
+        output_format = 'JPEG'
+        save_options = {'quality': 95}
+    elif output_format == 'PNG':
+        # optimize=True brute-forces filter choices; pin it off explicitly
+        save_options = {'optimize': False, 'compress_level': compress_level}
+    elif output_format == 'WEBP':
+        save_options = {
+            'lossless': True, 'method': DEFAULT_WEBP_METHOD, 'quality': DEFAULT_WEBP_EFFORT,
+        }
+
+    def encode(text: str) -> memoryview:
+        img = create_text_image(text, width, height, font, text_color, bg_color, padding)
+
+        # Encode in memory so the file is written with a single call
+        buffer = io.BytesIO()
+        img.save(buffer, output_format, **save_options)
+        return buffer.getbuffer()
+
+    return encode
+
+
+def _render_line(
+    task: Tuple[str, Path], encode: Callable[[str], memoryview]
+) -> Tuple[Optional[float], Optional[str]]:
+    """
+    Render one line of text and save it as an image.
+
+    Args:
+        task: (text, output_file)
+        encode: Line encoder from make_line_encoder
+
+    Returns:
+        Tuple of (file size in KB, None) on success or (None, error message)
+    """
+    text, output_file = task
+    try:
+        data = encode(text)
+        output_file.write_bytes(data)
+        return data.nbytes / 1024, None  # KB
+    except Exception as e:
+        return None, str(e)
+
+
+def _render_lines_overlapped(
+    tasks: List[Tuple[str, Path]], encode: Callable[[str], memoryview]
+) -> List[Tuple[Optional[float], Optional[str]]]:
+    """
+    Render lines in this process, writing each file on an I/O thread
+    while the next line is encoded.
+
+    Args:
+        tasks: (text, output_file) per line
+        encode: Line encoder from make_line_encoder
+
+    Returns:
+        One (file size in KB, error message) tuple per task, in order
+    """
+    pending = []
+    with ThreadPoolExecutor(max_workers=DEFAULT_WRITE_THREADS) as io_pool:
+        for text, output_file in tasks:
+            try:
+                data = encode(text)
+            except Exception as e:
+                pending.append((None, str(e)))
+                continue
+            # Each task targets a unique path, so writes never race
+            pending.append((io_pool.submit(output_file.write_bytes, data), data.nbytes / 1024))
+
+    results = []
+    for write, value in pending:
+        if write is None:
+            results.append((None, value))
+            continue
+        try:
+            write.result()
+            results.append((value, None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+# Line encoder for the current worker process, built once by _init_render_worker
+_worker_encode: Optional[Callable[[str], memoryview]] = None
+
+
+def _init_render_worker(*encoder_args) -> None:
+    """Build the line encoder once per worker process instead of once per task."""
+    global _worker_encode
+    _worker_encode = make_line_encoder(*encoder_args)
+
+
+def _render_line_in_worker(task: Tuple[str, Path]) -> Tuple[Optional[float], Optional[str]]:
+    """Render one line using the worker process's encoder."""
+    return _render_line(task, _worker_encode)
+
+
 def process_text_file(
     input_file: str,
     output_folder: str,
@@ -135,6 +306,7 @@ def process_text_file(
     bg_color: Tuple[int, int, int] = DEFAULT_BG_COLOR,
     output_format: str = DEFAULT_FORMAT,
     padding: int = DEFAULT_PADDING,
+    compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
 ) -> int:
     """
     Process a text file and create images for each line.
@@ -150,6 +322,7 @@ def process_text_file(
         bg_color: RGB background color
         output_format: Image format (PNG, JPEG, etc.)
         padding: Padding around text (pixels)
+        compress_level: PNG zlib compression level (0-9)
 
     Returns:
         Number of images created
@@ -174,7 +347,7 @@ def process_text_file(
     # Read lines from file
     try:
         with open(input_file, 'r', encoding='utf-8') as f:
-            lines = [line.strip() for line in f if line.strip()]
+            lines = [stripped for line in f if (stripped := line.strip())]
     except Exception as e:
         msg.error(f"Failed to read file {input_file}: {e}")
         return 0
@@ -185,48 +358,62 @@ def process_text_file(
 
     batch_started(len(lines), "lines")
 
-    # Process each line
-    created_count = 0
+    # Build one render task per distinct line; repeats reuse its output
     extension = IMAGE_FORMAT_EXTENSIONS.get(output_format.upper(), '.png')
+    tasks = []
+    first_task: Dict[str, int] = {}
+    outputs = []  # (line number, output file, index of the rendering task)
 
     for idx, line in enumerate(lines, 1):
-        if not line:
-            continue
-
-        processing_started(f"Creating image {idx}/{len(lines)}", None)
-
-        # Create image
-        img = create_text_image(
-            line, width, height, font, text_color, bg_color, padding
-        )
-
         # Generate output filename
         # Use line number and sanitized text for filename
-        safe_text = "".join(c if c.isalnum() or c in (' ', '_', '-') else '_' for c in line)
-
         # Warn if text will be cropped in filename
-        max_filename_length = 50
-        if len(safe_text) > max_filename_length:
-            msg.warning(f"Line {idx} text too long for filename ('{line[:30]}...'), will be cropped to {max_filename_length} characters")
+        if len(line) > MAX_FILENAME_TEXT_LENGTH:
+            msg.warning(f"Line {idx} text too long for filename ('{line[:30]}...'), will be cropped to {MAX_FILENAME_TEXT_LENGTH} characters")
 
-        safe_text = safe_text[:max_filename_length]  # Limit filename length
+        # Sanitizing maps each character to one character, so crop first
+        safe_text = _sanitize_filename(line[:MAX_FILENAME_TEXT_LENGTH])
         output_file = output_path / f"line_{idx:03d}_{safe_text}{extension}"
 
-        # Save image
-        try:
-            if output_format.upper() == 'JPEG' or output_format.upper() == 'JPG':
-                # Convert to RGB for JPEG (no transparency)
-                img = img.convert('RGB')
-                img.save(output_file, output_format, quality=95)
-            else:
-                img.save(output_file, output_format)
+        task_index = first_task.get(line)
+        if task_index is None:
+            task_index = first_task[line] = len(tasks)
+            tasks.append((line, output_file))
+        outputs.append((idx, output_file, task_index))
 
-            file_size = output_file.stat().st_size / 1024  # KB
-            file_created(output_file, file_size)
-            created_count += 1
+    # Render and encode in worker processes when there is more than one core,
+    # enough lines to pay for starting them, and the font can be sent to them
+    # (fonts loaded from a file path)
+    workers = min(os.cpu_count() or 1, len(tasks))
+    created_count = 0
+    encoder_args = (
+        width, height, font, text_color, bg_color, output_format, padding, compress_level,
+    )
 
-        except Exception as e:
-            msg.error(f"Failed to save image for line {idx}: {e}")
+    use_processes = workers > 1 and len(tasks) >= DEFAULT_MIN_PROCESS_LINES
+    if use_processes and isinstance(getattr(font, "path", None), str):
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_render_worker, initargs=encoder_args
+        ) as executor:
+            results = list(executor.map(_render_line_in_worker, tasks, chunksize=4))
+    else:
+        # Serial path: overlap each file write with encoding the next line
+        results = _render_lines_overlapped(tasks, make_line_encoder(*encoder_args))
+
+    for idx, output_file, task_index in outputs:
+        file_size, error = results[task_index]
+        rendered_file = tasks[task_index][1]
+        if error is None and output_file != rendered_file:
+            # Repeated line: copy the identical image instead of re-encoding it
+            try:
+                shutil.copyfile(rendered_file, output_file)
+            except OSError as e:
+                error = str(e)
+        if error is not None:
+            msg.error(f"Failed to save image for line {idx}: {error}")
+            continue
+        file_created(output_file, file_size)
+        created_count += 1
 
     batch_completed(created_count, "images")
     msg.info(f"Output saved to '{output_folder}' folder")
@@ -341,13 +528,16 @@ def get_format_input() -> str:
     print("1. PNG (default - lossless)")
     print("2. JPEG (smaller file size)")
     print("3. WEBP")
+    print("4. BMP (uncompressed - fastest, for re-encoding pipelines)")
 
-    choice = input("\nSelect format (1-3): ").strip()
+    choice = input("\nSelect format (1-4): ").strip()
 
     if choice == "2":
         return ImageFormat.JPEG.value
     elif choice == "3":
         return ImageFormat.WEBP.value
+    elif choice == "4":
+        return ImageFormat.BMP.value
     else:
         return ImageFormat.PNG.value
 